@@ -5,6 +5,7 @@ Provides optimized SQLite connections with proper settings.
 
 import sqlite3
 from contextlib import contextmanager
+from pathlib import Path
 from typing import Generator
 
 
@@ -15,7 +16,9 @@ def get_optimized_connection(db_path: str = "index/library.db") -> sqlite3.Conne
     SQLite doesn't support traditional connection pooling like PostgreSQL,
     but we can optimize individual connections with proper PRAGMA settings.
     """
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+    # Connections are reused, so keep more prepared statements around than the
+    # default 128 (the per-field edit statements add up)
+    conn = sqlite3.connect(db_path, check_same_thread=False, cached_statements=256)
 
     # Enable WAL mode for better concurrency (multiple readers, one writer)
     conn.execute("PRAGMA journal_mode = WAL")
@@ -32,6 +35,35 @@ def get_optimized_connection(db_path: str = "index/library.db") -> sqlite3.Conne
     # Enable memory-mapped I/O for reads (256MB)
     conn.execute("PRAGMA mmap_size = 268435456")
 
+    # Wait inside SQLite (up to 5s) for a lock to clear instead of failing with SQLITE_BUSY
+    conn.execute("PRAGMA busy_timeout = 5000")
+
+    return conn
+
+
+def get_read_connection(db_path: str = "index/library.db") -> sqlite3.Connection:
+    """
+    Create an optimized read-only connection for search/scoring.
+
+    Opened with mode=ro so SQLite never takes write locks or journals, and
+    intended to be held open and reused so the schema parse, statement
+    cache and page cache carry over between requests.
+    """
+    uri = Path(db_path).resolve().as_uri() + "?mode=ro"
+    conn = sqlite3.connect(uri, uri=True, check_same_thread=False, cached_statements=256)
+
+    # Larger page cache for long-lived readers (64MB)
+    conn.execute("PRAGMA cache_size = -65536")
+
+    # Keep temp tables (sorts, window functions) in memory
+    conn.execute("PRAGMA temp_store = memory")
+
+    # Serve FTS segment reads straight from memory-mapped pages (1GB)
+    conn.execute("PRAGMA mmap_size = 1073741824")
+
+    # Wait inside SQLite if a checkpoint briefly holds a lock
+    conn.execute("PRAGMA busy_timeout = 5000")
+
     return conn
 
 
@@ -101,12 +101,15 @@ async def edit_book(book_id: int, updates: BookEditRequest, request: Request):
             edited_by=client_ip
         )
 
+        # Fields sent with their current value are reported as 'unchanged'
+        updated = sum(1 for result in results if result['status'] == 'success')
+
         return EditResponse(
             success=True,
             entity_type='book',
             entity_id=book_id,
             edits_applied=results,
-            message=f"Successfully updated {len(results)} field(s)"
+            message=f"Successfully updated {updated} field(s)"
         )
 
     except InvalidFieldError as e:
@@ -160,12 +163,15 @@ async def edit_quote(quote_id: int, updates: QuoteEditRequest, request: Request)
             edited_by=client_ip
         )
 
+        # Fields sent with their current value are reported as 'unchanged'
+        updated = sum(1 for result in results if result['status'] == 'success')
+
         return EditResponse(
             success=True,
             entity_type='quote',
             entity_id=quote_id,
             edits_applied=results,
-            message=f"Successfully updated {len(results)} field(s)"
+            message=f"Successfully updated {updated} field(s)"
         )
 
     except InvalidFieldError as e:
@@ -4,14 +4,26 @@ Handles direct database updates for book and quote metadata.
 """
 
 import sqlite3
-import time
 import logging
+import threading
 from typing import Dict, Any, List, Optional
 
 from api.db import get_optimized_connection
 
 logger = logging.getLogger(__name__)
 
+# Fields stored as INTEGER columns; numeric strings are coerced before writing
+_INT_FIELDS = frozenset({'year', 'page'})
+
+
+def _coerce_value(field_name: str, value: Any) -> Any:
+    """Coerce clearly-numeric strings to int for integer fields (no try/except on the hot path)."""
+    if field_name in _INT_FIELDS and isinstance(value, str):
+        digits = value[1:] if value[:1] == '-' else value
+        if digits.isdecimal():
+            return int(value)
+    return value
+
 
 class DatabaseLockError(Exception):
     """Raised when database is locked after retries."""
@@ -44,16 +56,38 @@ class EditorService:
         'quote_text', 'page', 'keywords', 'section'
     }
 
-    def __init__(self, db_path: str = "index/library.db", max_retries: int = 3):
+    # Precomputed error messages and entity_type -> (table, allowed fields, message) dispatch
+    _BOOK_FIELDS_MSG = ', '.join(sorted(ALLOWED_BOOK_FIELDS))
+    _QUOTE_FIELDS_MSG = ', '.join(sorted(ALLOWED_QUOTE_FIELDS))
+    _TABLE_BY_TYPE = {
+        'book': ('books', ALLOWED_BOOK_FIELDS, _BOOK_FIELDS_MSG),
+        'quote': ('quotes', ALLOWED_QUOTE_FIELDS, _QUOTE_FIELDS_MSG),
+    }
+
+    def __init__(self, db_path: str = "index/library.db", max_retries: int = 2):
         self.db_path = db_path
         self.max_retries = max_retries
+        self._local = threading.local()
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """Return this thread's persistent connection, reopened if db_path changed."""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None or self._local.db_path != self.db_path:
+            if conn is not None:
+                conn.close()
+            conn = get_optimized_connection(self.db_path)
+            conn.row_factory = sqlite3.Row
+            self._local.conn = conn
+            self._local.db_path = self.db_path
+        return conn
 
     def _retry_on_lock(self, operation, *args, **kwargs):
         """
-        Retry an operation if SQLite database is locked.
+        Retry an operation if SQLite database is still locked.
 
-        SQLite can return SQLITE_BUSY if another process has the database locked.
-        This is common in WAL mode with concurrent readers/writers.
+        Connections set PRAGMA busy_timeout, so SQLite already waits for the
+        lock inside the C layer; this is only a safety net for the rare case
+        where that timeout expires, and it retries immediately without sleeping.
         """
         last_error = None
 
@@ -63,41 +97,31 @@ class EditorService:
             except sqlite3.OperationalError as e:
                 if "database is locked" in str(e).lower():
                     last_error = e
-                    if attempt < self.max_retries - 1:
-                        # Exponential backoff: 0.1s, 0.2s, 0.4s
-                        wait_time = 0.1 * (2 ** attempt)
-                        logger.warning(f"Database locked, retrying in {wait_time}s (attempt {attempt + 1}/{self.max_retries})")
-                        time.sleep(wait_time)
-                        continue
-                else:
-                    # Not a lock error, re-raise immediately
-                    raise
+                    logger.warning(f"Database locked after busy timeout (attempt {attempt + 1}/{self.max_retries})")
+                    continue
+                # Not a lock error, re-raise immediately
+                raise
 
         # All retries exhausted
-        raise DatabaseLockError(f"Database locked after {self.max_retries} retries") from last_error
+        raise DatabaseLockError(f"Database locked after {self.max_retries} attempts") from last_error
 
     def _validate_field(self, entity_type: str, field_name: str) -> str:
         """
         Validate entity type and field name, return table name.
         Raises InvalidFieldError if validation fails.
         """
-        if entity_type == 'book':
-            if field_name not in self.ALLOWED_BOOK_FIELDS:
-                raise InvalidFieldError(
-                    f"Invalid field '{field_name}' for book edits. "
-                    f"Allowed fields: {', '.join(sorted(self.ALLOWED_BOOK_FIELDS))}"
-                )
-            return 'books'
-        elif entity_type == 'quote':
-            if field_name not in self.ALLOWED_QUOTE_FIELDS:
-                raise InvalidFieldError(
-                    f"Invalid field '{field_name}' for quote edits. "
-                    f"Allowed fields: {', '.join(sorted(self.ALLOWED_QUOTE_FIELDS))}"
-                )
-            return 'quotes'
-        else:
+        entry = self._TABLE_BY_TYPE.get(entity_type)
+        if entry is None:
             raise InvalidFieldError(f"Invalid entity_type: {entity_type}. Must be 'book' or 'quote'")
 
+        table_name, allowed_fields, allowed_msg = entry
+        if field_name not in allowed_fields:
+            raise InvalidFieldError(
+                f"Invalid field '{field_name}' for {entity_type} edits. "
+                f"Allowed fields: {allowed_msg}"
+            )
+        return table_name
+
     def save_edit(
         self,
         entity_type: str,
@@ -114,42 +138,11 @@ class EditorService:
             EntityNotFoundError: If entity does not exist
             DatabaseLockError: If database is locked after retries
         """
-        table_name = self._validate_field(entity_type, field_name)
-
-        def _perform_edit():
-            conn = get_optimized_connection(self.db_path)
-            conn.row_factory = sqlite3.Row
-            try:
-                cursor = conn.cursor()
-
-                # Get current value
-                cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE id = ?", (entity_id,))
-                row = cursor.fetchone()
-                if not row:
-                    raise EntityNotFoundError(f"{entity_type} with id {entity_id} not found")
-
-                old_value = row[0]
-
-                # Update the field directly
-                cursor.execute(
-                    f"UPDATE {table_name} SET {field_name} = ? WHERE id = ?",
-                    (new_value, entity_id)
-                )
-
-                conn.commit()
-
-                return {
-                    "entity_type": entity_type,
-                    "entity_id": entity_id,
-                    "field_name": field_name,
-                    "old_value": old_value,
-                    "new_value": new_value,
-                    "status": "success"
-                }
-            finally:
-                conn.close()
-
-        return self._retry_on_lock(_perform_edit)
+        # Same single-transaction path (BEGIN IMMEDIATE, one UPDATE, one commit)
+        # as multi-field edits
+        return self.save_multiple_edits(
+            entity_type, entity_id, {field_name: new_value}, edited_by
+        )[0]
 
     def save_multiple_edits(
         self,
@@ -171,54 +164,62 @@ class EditorService:
         table_name = None
         for field_name in updates.keys():
             table_name = self._validate_field(entity_type, field_name)
+        updates = {field_name: _coerce_value(field_name, value) for field_name, value in updates.items()}
 
         def _perform_multiple_edits():
             results = []
 
-            conn = get_optimized_connection(self.db_path)
-            conn.row_factory = sqlite3.Row
+            conn = self._get_connection()
+            cursor = conn.cursor()
+
             try:
-                cursor = conn.cursor()
-
-                try:
-                    # Verify entity exists first
-                    cursor.execute(f"SELECT id FROM {table_name} WHERE id = ?", (entity_id,))
-                    if not cursor.fetchone():
-                        raise EntityNotFoundError(f"{entity_type} with id {entity_id} not found")
-
-                    # Process all edits in a single transaction
-                    for field_name, new_value in updates.items():
-                        # Get current value
-                        cursor.execute(f"SELECT {field_name} FROM {table_name} WHERE id = ?", (entity_id,))
-                        row = cursor.fetchone()
-                        old_value = row[0] if row else None
-
-                        # Update the field
-                        cursor.execute(
-                            f"UPDATE {table_name} SET {field_name} = ? WHERE id = ?",
-                            (new_value, entity_id)
-                        )
-
-                        results.append({
-                            "entity_type": entity_type,
-                            "entity_id": entity_id,
-                            "field_name": field_name,
-                            "old_value": old_value,
-                            "new_value": new_value,
-                            "status": "success"
-                        })
-
-                    # Commit transaction - all edits succeed together
-                    conn.commit()
-                    logger.info(f"Successfully saved {len(results)} edits for {entity_type} {entity_id}")
-
-                except Exception as e:
-                    # Rollback transaction on any error
-                    conn.rollback()
-                    logger.error(f"Failed to save edits for {entity_type} {entity_id}: {e}")
-                    raise
-            finally:
-                conn.close()
+                fields = list(updates.keys())
+
+                # Take the write lock up front so the read and the UPDATE
+                # form one transaction and never need a lock upgrade
+                cursor.execute("BEGIN IMMEDIATE")
+
+                # Verify entity exists and fetch all current values in one query
+                cursor.execute(
+                    f"SELECT {', '.join(fields)} FROM {table_name} WHERE id = ?",
+                    (entity_id,)
+                )
+                row = cursor.fetchone()
+                if not row:
+                    raise EntityNotFoundError(f"{entity_type} with id {entity_id} not found")
+
+                # Only fields whose value actually differs need writing
+                changed = {f: v for f, v in updates.items() if row[f] != v}
+
+                if changed:
+                    # Update all changed fields with a single statement
+                    set_clause = ', '.join(f"{field_name} = ?" for field_name in changed)
+                    cursor.execute(
+                        f"UPDATE {table_name} SET {set_clause} WHERE id = ?",
+                        (*changed.values(), entity_id)
+                    )
+
+                for field_name, new_value in updates.items():
+                    old_value = row[field_name]
+
+                    results.append({
+                        "entity_type": entity_type,
+                        "entity_id": entity_id,
+                        "field_name": field_name,
+                        "old_value": old_value,
+                        "new_value": new_value,
+                        "status": "success" if field_name in changed else "unchanged"
+                    })
+
+                # Commit transaction - all edits succeed together
+                conn.commit()
+                logger.info(f"Successfully saved {len(results)} edits for {entity_type} {entity_id}")
+
+            except Exception as e:
+                # Rollback transaction on any error
+                conn.rollback()
+                logger.error(f"Failed to save edits for {entity_type} {entity_id}: {e}")
+                raise
 
             return results
 
@@ -235,28 +236,24 @@ class EditorService:
             InvalidFieldError: If entity_type is invalid
             DatabaseLockError: If database is locked after retries
         """
-        if entity_type not in ('book', 'quote'):
+        if entity_type not in self._TABLE_BY_TYPE:
             raise InvalidFieldError(f"Invalid entity_type: {entity_type}. Must be 'book' or 'quote'")
 
         def _get_entity():
-            conn = get_optimized_connection(self.db_path)
-            conn.row_factory = sqlite3.Row
-            try:
-                cursor = conn.cursor()
+            conn = self._get_connection()
+            cursor = conn.cursor()
 
-                # Get entity data
-                if entity_type == 'book':
-                    cursor.execute("SELECT * FROM books WHERE id = ?", (entity_id,))
-                else:  # quote
-                    cursor.execute("SELECT * FROM quotes WHERE id = ?", (entity_id,))
+            # Get entity data
+            if entity_type == 'book':
+                cursor.execute("SELECT * FROM books WHERE id = ?", (entity_id,))
+            else:  # quote
+                cursor.execute("SELECT * FROM quotes WHERE id = ?", (entity_id,))
 
-                row = cursor.fetchone()
-                if not row:
-                    return None
+            row = cursor.fetchone()
+            if not row:
+                return None
 
-                return dict(row)
-            finally:
-                conn.close()
+            return dict(row)
 
         return self._retry_on_lock(_get_entity)
 
@@ -1,15 +1,53 @@
 """Scoring service implementing BM25 + phrase bonus algorithm with configurable weights."""
 
+import json
+import os
 import re
 import sqlite3
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
-from api.db import get_optimized_connection
+from api.db import get_read_connection
 
 # Search configuration constants
 MAX_SEARCH_RESULTS = 1000  # FTS query limit before ranking
 TOP_QUOTES_PER_BOOK = 5    # Number of quotes shown per book in results
 DEFAULT_SEARCH_LIMIT = 20  # Default pagination limit
+RESULT_CACHE_SIZE = 256    # Ranked result lists kept for repeated queries/pagination
+
+# FieldWeights attributes for each quotes_fts column, in column order
+FTS_WEIGHT_FIELDS = (
+    'quote_text', 'quote_keywords', 'book_title', 'book_authors', 'book_keywords', 'summary'
+)
+
+
+@dataclass
+class ScoredQuote:
+    """A scored FTS hit."""
+    # Declared by hand (dataclass(slots=True) needs Python 3.10)
+    __slots__ = (
+        'id', 'book_id', 'quote_text', 'page', 'keywords',
+        'score', 'phrase_bonus', 'base_score', 'book_hits'
+    )
+
+    id: int
+    book_id: int
+    quote_text: Optional[str]  # None until fetched when no phrase check needed it
+    page: Optional[int]
+    keywords: Optional[str]
+    score: float
+    phrase_bonus: float
+    base_score: float
+    book_hits: int  # FTS hits for this book, including quotes trimmed in SQL
+
+
+@lru_cache(maxsize=512)
+def _phrase_pattern(phrase: str) -> re.Pattern:
+    """Compile (once per phrase) the word-bounded, case-insensitive phrase regex."""
+    return re.compile(r'\b' + re.escape(phrase) + r'\b', re.IGNORECASE)
 
 
 class QuoteScorer:
@@ -19,6 +57,67 @@ class QuoteScorer:
         self.phrase_bonus = phrase_bonus
         self.scoring_config = None
         self.local_overrides = None
+        # Per-thread persistent read connections, keyed by db_path
+        self._local = threading.local()
+        # LRU of fully ranked book lists, keyed on query + database version
+        self._result_cache = OrderedDict()
+        self._cache_lock = threading.Lock()
+
+    def _get_connection(self, db_path: str) -> sqlite3.Connection:
+        """Return this thread's persistent read-only connection for db_path."""
+        conns = getattr(self._local, 'conns', None)
+        if conns is None:
+            conns = self._local.conns = {}
+
+        conn = conns.get(db_path)
+        if conn is None:
+            conn = get_read_connection(db_path)
+            conn.row_factory = sqlite3.Row
+            conns[db_path] = conn
+        return conn
+
+    def warm_up(self, db_path: str) -> None:
+        """
+        Open the calling thread's read connection for db_path ahead of its first search
+        and read the FTS segment pages once, so that search doesn't pay for either.
+        """
+        conn = self._get_connection(db_path)
+        conn.execute("SELECT COUNT(*) FROM quotes_fts_data").fetchone()
+
+    def _db_version(self, db_path: str) -> tuple:
+        """Cheap token that changes whenever the database or its WAL is written."""
+        version = []
+        for path in (db_path, db_path + '-wal'):
+            try:
+                stat = os.stat(path)
+                version.append((stat.st_mtime_ns, stat.st_size))
+            except FileNotFoundError:
+                version.append(None)
+        return tuple(version)
+
+    def _config_key(self) -> tuple:
+        """Fingerprint of the scoring settings a ranking was computed with."""
+        config = self.scoring_config.model_dump_json() if self.scoring_config else None
+        return (self.phrase_bonus, config)
+
+    def _cached_ranking(self, kind: str, db_path: str, fts_query: str,
+                        exact_phrase: Optional[str], rank) -> List[Dict[str, Any]]:
+        """Return the ranked book list for a query, computing it with rank(conn) on a miss."""
+        key = (kind, db_path, self._db_version(db_path), fts_query, exact_phrase, self._config_key())
+
+        with self._cache_lock:
+            sorted_books = self._result_cache.get(key)
+            if sorted_books is not None:
+                self._result_cache.move_to_end(key)
+                return sorted_books
+
+        sorted_books = rank(self._get_connection(db_path))
+
+        with self._cache_lock:
+            self._result_cache[key] = sorted_books
+            if len(self._result_cache) > RESULT_CACHE_SIZE:
+                self._result_cache.popitem(last=False)
+        return sorted_books
 
     def update_config(self, scoring_config=None, local_overrides=None):
         """Update scoring configuration and local overrides."""
@@ -31,139 +130,160 @@ class QuoteScorer:
     def search_and_score(self, db_path: str, fts_query: str, exact_phrase: Optional[str] = None,
                         offset: int = 0, limit: int = 20) -> Dict[str, Any]:
         """Search quotes using FTS5 and return book-grouped results."""
-        conn = get_optimized_connection(db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-
+        def _rank(conn):
             quotes = self._search_quotes(conn, fts_query, exact_phrase)
             book_results = self._group_by_book(conn, quotes, fts_query)
-
-            sorted_books = sorted(
-                book_results.values(),
-                key=lambda x: (x['top_quotes'][0]['score'] if x['top_quotes'] else 0),
+            return sorted(
+                book_results.items(),
+                key=lambda item: (item[1]['top_quotes'][0]['score'] if item[1]['top_quotes'] else 0),
                 reverse=True
             )
 
-            total = len(sorted_books)
-            paginated_books = sorted_books[offset:offset + limit]
+        sorted_books = self._cached_ranking('score', db_path, fts_query, exact_phrase, _rank)
 
-            return {
-                "results": paginated_books,
-                "total": total,
-                "offset": offset,
-                "limit": limit
-            }
-        finally:
-            conn.close()
+        total = len(sorted_books)
+        page = dict(sorted_books[offset:offset + limit])
+
+        # Book metadata and quote text are only loaded for the requested page
+        self._hydrate_page(self._get_connection(db_path), page)
+        paginated_books = list(page.values())
+
+        return {
+            "results": paginated_books,
+            "total": total,
+            "offset": offset,
+            "limit": limit
+        }
 
     def search_with_breakdown(self, db_path: str, fts_query: str, exact_phrase: Optional[str] = None,
                              limit: int = 20) -> Dict[str, Any]:
         """Search with detailed score breakdown for tuning purposes."""
-        conn = get_optimized_connection(db_path)
-        conn.row_factory = sqlite3.Row
-        try:
+        def _rank(conn):
             quotes = self._search_quotes_with_breakdown(conn, fts_query, exact_phrase)
             book_results = self._group_by_book_with_breakdown(conn, quotes, fts_query)
-
-            sorted_books = sorted(
+            return sorted(
                 book_results.values(),
                 key=lambda x: (x['top_quotes'][0]['score'] if x['top_quotes'] else 0),
                 reverse=True
             )
 
-            return {
-                "results": sorted_books[:limit],
-                "total": len(sorted_books)
-            }
-        finally:
-            conn.close()
+        sorted_books = self._cached_ranking('breakdown', db_path, fts_query, exact_phrase, _rank)
+
+        return {
+            "results": sorted_books[:limit],
+            "total": len(sorted_books)
+        }
 
     def get_quote_by_id(self, db_path: str, quote_id: int) -> Optional[Dict[str, Any]]:
         """Get a single quote by ID with full book metadata."""
-        conn = get_optimized_connection(db_path)
-        conn.row_factory = sqlite3.Row
-        try:
-            sql = """
-            SELECT
-                q.id, q.quote_text, q.page, q.section, q.keywords, q.source_file,
-                b.id as book_id, b.title, b.authors, b.year, b.publisher,
-                b.container as journal, b.doi, b.issn as isbn, b.doc_summary as summary, b.doc_keywords as keywords
-            FROM quotes q
-            JOIN books b ON q.book_id = b.id
-            WHERE q.id = ?
-            """
-
-            cursor = conn.cursor()
-            cursor.execute(sql, (quote_id,))
-            row = cursor.fetchone()
-
-            if not row:
-                return None
-
-            # Data is read directly from database (edits are already applied)
-            return {
-                "id": row['id'],
-                "quote_text": row['quote_text'],
-                "page": row['page'],
-                "section": row['section'],
-                "keywords": row['keywords'],
-                "book": {
-                    "id": row['book_id'],
-                    "title": row['title'],
-                    "authors": row['authors'],
-                    "year": row['year'],
-                    "publisher": row['publisher'],
-                    "journal": row['journal'],
-                    "doi": row['doi'],
-                    "isbn": row['isbn'],
-                    "themes": None,  # Not in database
-                    "summary": row['summary'],
-                    "keywords": row.get('keywords')  # Book keywords from doc_keywords
-                },
-                "citation": self._generate_basic_citation(row)
-            }
-        finally:
-            conn.close()
+        conn = self._get_connection(db_path)
+        sql = """
+        SELECT
+            q.id, q.quote_text, q.page, q.section, q.keywords, q.source_file,
+            b.id as book_id, b.title, b.authors, b.year, b.publisher,
+            b.container as journal, b.doi, b.issn as isbn, b.doc_summary as summary, b.doc_keywords as keywords
+        FROM quotes q
+        JOIN books b ON q.book_id = b.id
+        WHERE q.id = ?
+        """
+
+        cursor = conn.cursor()
+        cursor.execute(sql, (quote_id,))
+        row = cursor.fetchone()
+
+        if not row:
+            return None
+
+        # Data is read directly from database (edits are already applied)
+        return {
+            "id": row['id'],
+            "quote_text": row['quote_text'],
+            "page": row['page'],
+            "section": row['section'],
+            "keywords": row['keywords'],
+            "book": {
+                "id": row['book_id'],
+                "title": row['title'],
+                "authors": row['authors'],
+                "year": row['year'],
+                "publisher": row['publisher'],
+                "journal": row['journal'],
+                "doi": row['doi'],
+                "isbn": row['isbn'],
+                "themes": None,  # Not in database
+                "summary": row['summary'],
+                "keywords": row.get('keywords')  # Book keywords from doc_keywords
+            },
+            "citation": self._generate_basic_citation(row)
+        }
 
     def _search_quotes(self, conn: sqlite3.Connection, fts_query: str,
-                      exact_phrase: Optional[str] = None) -> List[Dict[str, Any]]:
+                      exact_phrase: Optional[str] = None) -> List[ScoredQuote]:
         """Search quotes using FTS5 and calculate scores."""
         if not fts_query:
             return []
 
-        sql = """
-        SELECT
-            q.id, q.book_id, q.quote_text, q.page, q.keywords, q.source_file,
-            bm25(quotes_fts) as bm25_score
-        FROM quotes_fts fts
-        JOIN quotes q ON q.id = fts.rowid
-        WHERE quotes_fts MATCH ?
-        ORDER BY bm25(quotes_fts)
-        LIMIT ?
+        # Quote text is only needed up front for the phrase check; otherwise it
+        # is fetched afterwards for just the quotes that make it into results
+        text_column = 'q.quote_text' if exact_phrase else 'NULL as quote_text'
+
+        # Without a phrase bonus rank order is final, so only the top N quotes
+        # per book need to leave SQLite; a phrase bonus can promote any hit
+        per_book_limit = MAX_SEARCH_RESULTS if exact_phrase else TOP_QUOTES_PER_BOOK
+
+        # FTS5-only inner query lets rank ORDER BY + LIMIT terminate early
+        # before the outer join runs
+        sql = f"""
+        SELECT * FROM (
+            SELECT
+                q.id, q.book_id, {text_column}, q.page, q.keywords,
+                fts.rank as bm25_score,
+                ROW_NUMBER() OVER (PARTITION BY q.book_id ORDER BY fts.rank, q.id) as book_rn,
+                COUNT(*) OVER (PARTITION BY q.book_id) as book_hits
+            FROM (
+                SELECT rowid, rank FROM quotes_fts
+                WHERE quotes_fts MATCH ?
+                ORDER BY rank
+                LIMIT ?
+            ) fts
+            JOIN quotes q ON q.id = fts.rowid
+        )
+        WHERE book_rn <= ?
+        ORDER BY bm25_score, id
         """
 
         cursor = conn.cursor()
-        cursor.execute(sql, (fts_query, MAX_SEARCH_RESULTS))
+        cursor.execute(sql, (fts_query, MAX_SEARCH_RESULTS, per_book_limit))
         rows = cursor.fetchall()
 
         quotes = []
+        bonus_applied = False
+        phrase_folded = exact_phrase.casefold() if exact_phrase else None
         for row in rows:
-            quote_data = dict(row)
-
+            quote_text = row['quote_text']
             phrase_bonus = 0.0
-            if exact_phrase and self._contains_exact_phrase(quote_data['quote_text'], exact_phrase):
+            if exact_phrase and self._contains_exact_phrase(quote_text, exact_phrase, phrase_folded):
                 phrase_bonus = self.phrase_bonus
+                bonus_applied = bonus_applied or phrase_bonus != 0.0
 
             # BM25 scores from FTS5 are negative (lower is better), negate for higher = better
-            base_score = -quote_data['bm25_score']
-            final_score = base_score + phrase_bonus
-
-            quote_data['score'] = final_score
-            quote_data['phrase_bonus'] = phrase_bonus
-            quote_data['base_score'] = base_score
-            quotes.append(quote_data)
+            base_score = -row['bm25_score']
+
+            quotes.append(ScoredQuote(
+                id=row['id'],
+                book_id=row['book_id'],
+                quote_text=quote_text,
+                page=row['page'],
+                keywords=row['keywords'],
+                score=base_score + phrase_bonus,
+                phrase_bonus=phrase_bonus,
+                base_score=base_score,
+                book_hits=row['book_hits']
+            ))
 
-        quotes.sort(key=lambda x: x['score'], reverse=True)
+        # Rows already arrive in rank order; only a phrase bonus can reorder them
+        if bonus_applied:
+            quotes.sort(key=lambda x: x.score, reverse=True)
         return quotes
 
     def _search_quotes_with_breakdown(self, conn: sqlite3.Connection, fts_query: str,
@@ -174,30 +294,35 @@ class QuoteScorer:
 
         field_weights = self.scoring_config.field_weights if self.scoring_config else None
 
+        # Weights for fields indexed in quotes_fts are applied by FTS5 itself as
+        # bm25 column weights; only non-indexed fields get Python-side bonuses
         sql = """
         SELECT
-            q.id, q.book_id, q.quote_text, q.page, q.keywords as quote_keywords, q.source_file,
-            bm25(quotes_fts) as base_bm25_score,
-            b.title as book_title, b.authors as book_authors, b.doc_keywords as book_keywords,
-            b.doc_summary as summary, b.publisher, b.container,
+            q.id, q.book_id, q.quote_text, q.page, q.keywords as quote_keywords,
+            fts.rank as base_bm25_score,
+            b.publisher, b.container,
             CASE
                 WHEN b.container IS NOT NULL AND b.container != '' THEN 'journal'
                 WHEN b.publisher IS NOT NULL AND b.publisher != '' THEN 'book'
                 ELSE 'unknown'
             END as book_type
-        FROM quotes_fts fts
+        FROM (
+            SELECT rowid, rank FROM quotes_fts
+            WHERE quotes_fts MATCH ? AND rank MATCH ?
+            ORDER BY rank
+            LIMIT ?
+        ) fts
         JOIN quotes q ON q.id = fts.rowid
         JOIN books b ON q.book_id = b.id
-        WHERE quotes_fts MATCH ?
-        ORDER BY bm25(quotes_fts)
-        LIMIT ?
+        ORDER BY fts.rank
         """
 
         cursor = conn.cursor()
-        cursor.execute(sql, (fts_query, MAX_SEARCH_RESULTS))
+        cursor.execute(sql, (fts_query, self._fts_rank_function(field_weights), MAX_SEARCH_RESULTS))
         rows = cursor.fetchall()
 
         quotes = []
+        phrase_folded = exact_phrase.casefold() if exact_phrase else None
         for row in rows:
             quote_data = dict(row)
 
@@ -212,7 +337,7 @@ class QuoteScorer:
 
             # Calculate phrase bonus
             phrase_bonus = 0.0
-            if exact_phrase and self._contains_exact_phrase(quote_data['quote_text'], exact_phrase):
+            if exact_phrase and self._contains_exact_phrase(quote_data['quote_text'], exact_phrase, phrase_folded):
                 phrase_bonus = self.phrase_bonus
 
             final_score = bm25_weighted + field_score + phrase_bonus
@@ -236,8 +361,15 @@ class QuoteScorer:
         quotes.sort(key=lambda x: x['score'], reverse=True)
         return quotes
 
+    def _fts_rank_function(self, field_weights) -> str:
+        """Build the FTS5 rank function with per-column bm25 weights."""
+        if not field_weights:
+            return 'bm25()'
+        weights = ', '.join(str(float(getattr(field_weights, field))) for field in FTS_WEIGHT_FIELDS)
+        return f'bm25({weights})'
+
     def _calculate_field_scores(self, quote_data: Dict[str, Any], query: str, field_weights) -> tuple[float, Dict[str, float]]:
-        """Calculate field-specific bonuses for a quote."""
+        """Calculate field-specific bonuses for fields not indexed in quotes_fts."""
         if not field_weights or not query:
             return 0.0, {}
 
@@ -247,12 +379,7 @@ class QuoteScorer:
 
         # Field mappings for cleaner code
         field_mappings = [
-            ('book_title', 'book_title'),
-            ('book_authors', 'book_authors'),
-            ('quote_keywords', 'quote_keywords'),
-            ('book_keywords', 'book_keywords'),
             ('themes', 'themes'),
-            ('summary', 'summary'),
             ('book_type', 'type'),
             ('publisher', 'publisher'),
             ('journal', 'journal')
@@ -267,75 +394,104 @@ class QuoteScorer:
 
         return field_score, field_matches
 
-    def _contains_exact_phrase(self, text: str, phrase: str) -> bool:
-        """Check if text contains the exact phrase (case-insensitive)."""
+    def _contains_exact_phrase(self, text: str, phrase: str, phrase_folded: Optional[str] = None) -> bool:
+        """
+        Check if text contains the exact phrase (case-insensitive).
+        Callers scanning many rows pass phrase_folded (phrase.casefold()) once.
+        """
         if not text or not phrase:
             return False
 
-        escaped_phrase = re.escape(phrase)
-        pattern = r'\b' + escaped_phrase + r'\b'
-        return bool(re.search(pattern, text, re.IGNORECASE))
+        if phrase_folded is None:
+            phrase_folded = phrase.casefold()
+
+        # Cheap substring reject first; only candidate rows pay for the
+        # word-boundary regex
+        if phrase_folded not in text.casefold():
+            return False
+        return _phrase_pattern(phrase).search(text) is not None
 
     def _fetch_book_metadata(self, conn: sqlite3.Connection, book_ids: List[int]) -> Dict[int, Dict[str, Any]]:
         """Fetch book metadata for given book IDs."""
         if not book_ids:
             return {}
 
-        placeholders = ','.join('?' * len(book_ids))
-        book_sql = f"""
+        # json_each keeps the SQL text constant regardless of list size, so
+        # the prepared statement is reused from sqlite3's statement cache
+        book_sql = """
         SELECT b.id, b.title, b.authors, b.year, b.publisher, b.container, b.entry_type, b.doi, b.issn,
                b.doc_keywords, b.doc_summary, b.source_path,
-               COUNT(q.id) as total_quotes
+               COALESCE(b.highlight_count, 0) as total_quotes
         FROM books b
-        LEFT JOIN quotes q ON b.id = q.book_id
-        WHERE b.id IN ({placeholders})
-        GROUP BY b.id, b.title, b.authors, b.year, b.publisher, b.container, b.entry_type, b.doi, b.issn,
-                 b.doc_keywords, b.doc_summary, b.source_path
+        WHERE b.id IN (SELECT value FROM json_each(?))
         """
 
         cursor = conn.cursor()
-        cursor.execute(book_sql, book_ids)
+        cursor.execute(book_sql, (json.dumps(book_ids),))
         book_rows = cursor.fetchall()
         return {row['id']: dict(row) for row in book_rows}
 
-    def _group_by_book(self, conn: sqlite3.Connection, quotes: List[Dict[str, Any]],
+    def _fill_quote_texts(self, conn: sqlite3.Connection, responses: Dict[int, Dict[str, Any]]) -> None:
+        """Load quote_text for the given quote responses, keyed by quote ID."""
+        cursor = conn.cursor()
+        cursor.execute(
+            "SELECT id, quote_text FROM quotes WHERE id IN (SELECT value FROM json_each(?))",
+            (json.dumps(list(responses)),)
+        )
+        for quote_id, quote_text in cursor.fetchall():
+            responses[quote_id]["quote_text"] = quote_text
+
+    def _group_by_book(self, conn: sqlite3.Connection, quotes: List[ScoredQuote],
                       original_query: str = None) -> Dict[int, Dict[str, Any]]:
-        """Group quotes by book and prepare book-level results."""
-        book_ids = list(set(quote['book_id'] for quote in quotes))
-        if not book_ids:
-            return {}
-
-        books_lookup = self._fetch_book_metadata(conn, book_ids)
+        """
+        Group quotes by book and prepare book-level results.
+        Book metadata and missing quote text are filled in later by _hydrate_page.
+        """
         book_results = {}
 
-        # Group quotes by book (data read directly from database)
         for quote in quotes:
-            book_id = quote['book_id']
+            book_id = quote.book_id
 
             if book_id not in book_results:
-                book_metadata = books_lookup.get(book_id, {})
                 book_results[book_id] = {
-                    "book": book_metadata,
-                    "hits_count": 0,
+                    "book": None,
+                    "hits_count": quote.book_hits,
                     "top_quotes": [],
-                    "total_book_quotes": book_metadata.get('total_quotes', 0)
+                    "total_book_quotes": 0
                 }
 
-            book_results[book_id]["hits_count"] += 1
-
             # Keep only top N quotes per book
             if len(book_results[book_id]["top_quotes"]) < TOP_QUOTES_PER_BOOK:
                 quote_response = {
-                    "id": quote['id'],
-                    "quote_text": quote['quote_text'],
-                    "page": quote.get('page'),
-                    "keywords": quote.get('keywords'),
-                    "score": round(quote['score'], 2)
+                    "id": quote.id,
+                    "quote_text": quote.quote_text,
+                    "page": quote.page,
+                    "keywords": quote.keywords,
+                    "score": round(quote.score, 2)
                 }
                 book_results[book_id]["top_quotes"].append(quote_response)
 
         return book_results
 
+    def _hydrate_page(self, conn: sqlite3.Connection, book_results: Dict[int, Dict[str, Any]]) -> None:
+        """Load book metadata and deferred quote text for one page of grouped results."""
+        pending_books = [book_id for book_id, result in book_results.items() if result["book"] is None]
+        if pending_books:
+            books_lookup = self._fetch_book_metadata(conn, pending_books)
+            for book_id in pending_books:
+                book_metadata = books_lookup.get(book_id, {})
+                book_results[book_id]["book"] = book_metadata
+                book_results[book_id]["total_book_quotes"] = book_metadata.get('total_quotes', 0)
+
+        pending_text = {
+            quote["id"]: quote
+            for result in book_results.values()
+            for quote in result["top_quotes"]
+            if quote["quote_text"] is None
+        }
+        if pending_text:
+            self._fill_quote_texts(conn, pending_text)
+
     def _group_by_book_with_breakdown(self, conn: sqlite3.Connection, quotes: List[Dict[str, Any]],
                                      original_query: str = None) -> Dict[int, Dict[str, Any]]:
         """Group quotes by book with score breakdown."""
@@ -14,10 +14,16 @@ Usage:
     python backup.py [--backup-dir /path/to/backups]
 """
 
+import hashlib
 import os
 import sys
+import sqlite3
+import tempfile
 import zipfile
 import shutil
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from pathlib import Path
 from datetime import datetime
 import argparse
@@ -29,6 +35,53 @@ def get_backup_filename():
     return f"library_backup_{timestamp}.zip"
 
 
+def snapshot_database(db_path: Path, snapshot_path: Path):
+    """
+    Copy a consistent snapshot of a (possibly live) SQLite database.
+
+    Uses SQLite's online backup API, so committed WAL content is included
+    and no separate -wal/-shm files are needed.
+    """
+    src = sqlite3.connect(db_path)
+    dst = sqlite3.connect(snapshot_path)
+    try:
+        src.backup(dst, pages=1024)
+    finally:
+        dst.close()
+        src.close()
+
+
+def add_files_parallel(zipf: zipfile.ZipFile, files: list, max_workers: int = 4) -> int:
+    """
+    Add (disk_path, arcname) pairs to an open archive.
+
+    File contents are read on a thread pool while the main thread compresses
+    and writes entries (ZipFile writes are not thread-safe). At most
+    2 * max_workers reads are in flight, so only a few files are held in
+    memory at once.
+
+    Returns:
+        Number of files added
+    """
+    def _read(item):
+        disk_path, arcname = item
+        return zipfile.ZipInfo.from_file(disk_path, arcname=arcname), disk_path.read_bytes()
+
+    count = 0
+    pending = deque()
+    items = iter(files)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for item in islice(items, 2 * max_workers):
+            pending.append(executor.submit(_read, item))
+        while pending:
+            zinfo, data = pending.popleft().result()
+            for item in islice(items, 1):
+                pending.append(executor.submit(_read, item))
+            zipf.writestr(zinfo, data, compress_type=zipf.compression, compresslevel=zipf.compresslevel)
+            count += 1
+    return count
+
+
 def create_backup(base_dir: Path, backup_dir: Path):
     """
     Create a ZIP archive containing all critical data files.
@@ -46,40 +99,46 @@ def create_backup(base_dir: Path, backup_dir: Path):
 
     print(f"Creating backup: {backup_path}")
 
-    with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        # Backup database
+    # Level 1 deflate: DB pages and FTS segments gain little from higher levels
+    with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
+        # Backup database from a consistent snapshot (includes WAL content)
         db_path = base_dir / 'index' / 'library.db'
         if db_path.exists():
-            zipf.write(db_path, arcname='index/library.db')
-            print(f"  ✓ Added database: {db_path.stat().st_size / 1024 / 1024:.2f} MB")
+            with tempfile.TemporaryDirectory(dir=backup_dir) as tmp_dir:
+                snapshot_path = Path(tmp_dir) / 'library.db'
+                snapshot_database(db_path, snapshot_path)
+                # Stored uncompressed with a SHA-256 sidecar, so verification
+                # hashes the raw bytes instead of inflating them first. The hash is
+                # taken in the same pass that copies the snapshot into the archive
+                zinfo = zipfile.ZipInfo.from_file(snapshot_path, arcname='index/library.db')
+                zinfo.compress_type = zipfile.ZIP_STORED
+                sha = hashlib.sha256()
+                with open(snapshot_path, 'rb') as src, zipf.open(zinfo, 'w') as dst:
+                    while True:
+                        chunk = src.read(1 << 20)
+                        if not chunk:
+                            break
+                        sha.update(chunk)
+                        dst.write(chunk)
+                zipf.writestr('index/library.db.sha256', f"{sha.hexdigest()}  library.db\n")
+                print(f"  ✓ Added database: {snapshot_path.stat().st_size / 1024 / 1024:.2f} MB")
         else:
             print(f"  ⚠ Database not found: {db_path}")
 
-        # Backup database WAL files (for SQLite consistency)
-        for wal_file in ['library.db-wal', 'library.db-shm']:
-            wal_path = base_dir / 'index' / wal_file
-            if wal_path.exists():
-                zipf.write(wal_path, arcname=f'index/{wal_file}')
-                print(f"  ✓ Added WAL file: {wal_file}")
-
         # Backup CSV files (bibliography)
-        csv_count = 0
         csv_dir = base_dir / 'data' / 'biblio'
         if csv_dir.exists():
-            for csv_file in csv_dir.glob('*.csv'):
-                zipf.write(csv_file, arcname=f'data/biblio/{csv_file.name}')
-                csv_count += 1
+            csv_files = [(f, f'data/biblio/{f.name}') for f in csv_dir.glob('*.csv')]
+            csv_count = add_files_parallel(zipf, csv_files)
             print(f"  ✓ Added {csv_count} CSV file(s)")
         else:
             print(f"  ⚠ CSV directory not found: {csv_dir}")
 
         # Backup JSON files (extracts/quotes)
-        json_count = 0
         json_dir = base_dir / 'data' / 'extracts'
         if json_dir.exists():
-            for json_file in json_dir.glob('*.json'):
-                zipf.write(json_file, arcname=f'data/extracts/{json_file.name}')
-                json_count += 1
+            json_files = [(f, f'data/extracts/{f.name}') for f in json_dir.glob('*.json')]
+            json_count = add_files_parallel(zipf, json_files)
             print(f"  ✓ Added {json_count} JSON file(s)")
         else:
             print(f"  ⚠ JSON directory not found: {json_dir}")
@@ -33,6 +33,10 @@ def add_performance_indexes(db_path="index/library.db"):
 
             # For quote lookups
             ("idx_quotes_page", "CREATE INDEX IF NOT EXISTS idx_quotes_page ON quotes(page)"),
+
+            # For linking extracts to books by source file or title
+            ("idx_books_source_path", "CREATE INDEX IF NOT EXISTS idx_books_source_path ON books(source_path)"),
+            ("idx_books_title", "CREATE INDEX IF NOT EXISTS idx_books_title ON books(title)"),
         ]
 
         created_count = 0
@@ -55,6 +59,16 @@ def add_performance_indexes(db_path="index/library.db"):
         conn.commit()
         print("✅ Analysis complete")
 
+        # Merge FTS5 segments into one b-tree so MATCH walks fewer segments
+        try:
+            cursor.execute("INSERT INTO quotes_fts(quotes_fts) VALUES('optimize')")
+            conn.commit()
+            print("✅ FTS index optimized")
+        except sqlite3.OperationalError as e:
+            print(f"⚠️  Skipped FTS optimize: {e}")
+
+        cursor.execute("PRAGMA optimize")
+
         return True
 
 
@@ -12,63 +12,131 @@ from pathlib import Path
 import argparse
 from typing import Dict, List, Optional
 import re
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:  # optional: stdlib json is used when orjson isn't installed
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:  # optional: fallback matching scans every key when it isn't installed
+    ahocorasick = None
 
 def setup_database(db_path: str) -> sqlite3.Connection:
     """Create database with optimized settings for Pi 4"""
     conn = sqlite3.connect(db_path)
 
+    # Larger pages for a fresh database; must precede the first write (and
+    # the switch to WAL), so it is a no-op on an existing index
+    conn.execute("PRAGMA page_size = 8192")
+
     # Pi 4 optimizations as per CLAUDE.md
     conn.execute("PRAGMA journal_mode = WAL")
     conn.execute("PRAGMA synchronous = NORMAL")
-    conn.execute("PRAGMA cache_size = 10000")
+    conn.execute("PRAGMA cache_size = -131072")  # 128MB, in KB regardless of page size
+    conn.execute("PRAGMA mmap_size = 268435456")  # 256MB
     conn.execute("PRAGMA temp_store = memory")
 
     return conn
 
-def create_tables(conn: sqlite3.Connection):
-    """Create books and quotes tables with FTS5 virtual table"""
+def enter_bulk_mode(conn: sqlite3.Connection):
+    """
+    Trade durability for load speed during a full rebuild.
+    A crash mid-build is recovered by rerunning the indexer, so skip fsyncs
+    and, when no other connection holds the database in WAL, journaling too.
+    """
+    conn.execute("PRAGMA synchronous = OFF")
 
-    # Books table - Updated to match FINAL_BIBLIO_ATLANTA.csv structure
-    conn.execute("""
-    CREATE TABLE IF NOT EXISTS books (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        title TEXT NOT NULL,
-        authors TEXT,
-        year INTEGER,
-        doi TEXT,
-        container TEXT,
-        entry_type TEXT,
-        volume TEXT,
-        issue TEXT,
-        pages TEXT,
-        publisher TEXT,
-        issn TEXT,
-        source_path TEXT,
-        meta_title TEXT,
-        meta_author TEXT,
-        web_url_guess TEXT,
-        domain_guess TEXT,
-        doc_summary TEXT,
-        doc_keywords TEXT,
-        highlight_count INTEGER
-    )
-    """)
+    # Leaving WAL needs exclusive access; the running API may still have the
+    # database open, in which case keep WAL rather than waiting on it
+    conn.execute("PRAGMA busy_timeout = 0")
+    try:
+        conn.execute("PRAGMA journal_mode = OFF")
+    except sqlite3.OperationalError:
+        print("Database in use, keeping WAL journal during rebuild")
+    conn.execute("PRAGMA busy_timeout = 5000")
 
-    # Quotes table - NOTE: Using JSON structure from data/extracts/*.json files
-    conn.execute("""
-    CREATE TABLE IF NOT EXISTS quotes (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        book_id INTEGER,
-        quote_text TEXT NOT NULL,
-        page INTEGER,
-        section TEXT,
-        keywords TEXT,
-        source_file TEXT,
-        FOREIGN KEY (book_id) REFERENCES books (id)
-    )
-    """)
+def exit_bulk_mode(conn: sqlite3.Connection):
+    """Restore the normal WAL settings from setup_database after a bulk load"""
+    conn.commit()
+    conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
 
-    # FTS5 virtual table for full-text search
+_YEAR_RE = re.compile(r'-?\d+(?:\.0*)?')
+
+def _parse_year(value: Optional[str]) -> Optional[int]:
+    """Parse a CSV year cell ("1999", "1999.0") to int, or None if not an integral number"""
+    year_str = (value or '').strip()
+    if _YEAR_RE.fullmatch(year_str):
+        return int(float(year_str))
+    return None
+
+# Books table - Updated to match FINAL_BIBLIO_ATLANTA.csv structure
+BOOKS_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS books (
+    id INTEGER PRIMARY KEY,
+    title TEXT NOT NULL,
+    authors TEXT,
+    year INTEGER,
+    doi TEXT,
+    container TEXT,
+    entry_type TEXT,
+    volume TEXT,
+    issue TEXT,
+    pages TEXT,
+    publisher TEXT,
+    issn TEXT,
+    source_path TEXT,
+    meta_title TEXT,
+    meta_author TEXT,
+    web_url_guess TEXT,
+    domain_guess TEXT,
+    doc_summary TEXT,
+    doc_keywords TEXT,
+    highlight_count INTEGER
+)
+"""
+
+# Quotes table - NOTE: Using JSON structure from data/extracts/*.json files
+QUOTES_TABLE_SQL = """
+CREATE TABLE IF NOT EXISTS quotes (
+    id INTEGER PRIMARY KEY,
+    book_id INTEGER,
+    quote_text TEXT NOT NULL,
+    page INTEGER,
+    section TEXT,
+    keywords TEXT,
+    source_file TEXT,
+    FOREIGN KEY (book_id) REFERENCES books (id)
+)
+"""
+
+# Full rebuild: drop everything and recreate the relational tables in one
+# script and one transaction (the FTS5 table is created after loading)
+RESET_SCHEMA_SQL = f"""
+BEGIN;
+DROP TABLE IF EXISTS quotes_fts;
+DROP TABLE IF EXISTS quotes;
+DROP TABLE IF EXISTS books;
+{BOOKS_TABLE_SQL};
+{QUOTES_TABLE_SQL};
+COMMIT;
+"""
+
+def create_tables(conn: sqlite3.Connection):
+    """Create books and quotes tables (the FTS5 table is created by create_fts_table)"""
+    conn.execute(BOOKS_TABLE_SQL)
+    conn.execute(QUOTES_TABLE_SQL)
+    conn.commit()
+
+def create_fts_table(conn: sqlite3.Connection):
+    """
+    Create the FTS5 virtual table for full-text search.
+    Created only once quotes are loaded (by rebuild_fts_index) so it is filled in one pass.
+    """
     # Note: We don't use content='quotes' anymore since we need to join with books table
     conn.execute("""
     CREATE VIRTUAL TABLE IF NOT EXISTS quotes_fts USING fts5(
@@ -81,7 +149,12 @@ def create_tables(conn: sqlite3.Connection):
     )
     """)
 
-    conn.commit()
+INSERT_BOOK_SQL = """
+INSERT INTO books (id, title, authors, year, doi, container, entry_type, volume, issue, pages,
+                 publisher, issn, source_path, meta_title, meta_author,
+                 web_url_guess, domain_guess, doc_summary, doc_keywords, highlight_count)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
 def load_bibliography(conn: sqlite3.Connection, csv_path: str) -> Dict[str, int]:
     """
@@ -96,74 +169,85 @@ def load_bibliography(conn: sqlite3.Connection, csv_path: str) -> Dict[str, int]
 
     book_mapping = {}
 
+    # Assign ids in Python so the whole CSV can go through one executemany
+    next_id = conn.execute("SELECT COALESCE(MAX(id), 0) FROM books").fetchone()[0] + 1
+
     with open(csv_path, 'r', encoding='utf-8') as f:
         # CSV uses semicolon delimiter
-        reader = csv.DictReader(f, delimiter=';')
-
-        for row in reader:
-            # FINAL_BIBLIO_ATLANTA.csv has simple column names (no _out/_in suffix)
-            title = row.get('title', '').strip()
-            authors = row.get('authors', '').strip()
-            source_path = row.get('source_path', '').strip()
-
-            # Skip empty rows
-            if not title and not source_path:
-                continue
-
-            # Extract year
-            year_str = row.get('year', '').strip()
-            year = None
-            if year_str and str(year_str).replace('.', '').replace('-', '').isdigit():
-                try:
-                    year = int(float(year_str))
-                except:
-                    pass
-
-            # Extract relevant fields using FINAL_BIBLIO_ATLANTA.csv column names
-            cursor = conn.cursor()
-            cursor.execute("""
-            INSERT INTO books (title, authors, year, doi, container, entry_type, volume, issue, pages,
-                             publisher, issn, source_path, meta_title, meta_author,
-                             web_url_guess, domain_guess, doc_summary, doc_keywords, highlight_count)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                title,
-                authors,
-                year,
-                row.get('doi', '').strip(),
-                row.get('container', '').strip() or row.get('journal', '').strip(),
-                row.get('entry_type', '').strip(),
-                row.get('volume', '').strip(),
-                row.get('issue', '').strip(),
-                row.get('pages', '').strip(),
-                row.get('publisher', '').strip(),
-                row.get('isbn', '').strip(),
-                source_path,
-                row.get('source_title', '').strip(),
-                authors,  # Use authors as meta_author fallback
-                row.get('url', '').strip(),
-                '',  # domain_guess not in CSV
-                row.get('abstract', '').strip(),
-                row.get('keywords', '').strip(),
-                0  # highlight_count will be calculated
-            ))
-
-            book_id = cursor.lastrowid
-
-            # Create mapping for linking with extracts using source_path
-            source_path = row.get('source_path', '')
-            if source_path:
-                # Extract filename from path for matching
-                filename = Path(source_path).stem
-                book_mapping[filename] = book_id
-
-                # Also map by full path
-                book_mapping[source_path] = book_id
-
-            # Also map by title for fallback matching
-            title = row.get('title', '').strip()
-            if title:
-                book_mapping[title] = book_id
+        reader = csv.reader(f, delimiter=';')
+        header = next(reader, [])
+
+        # Resolve column positions once; absent columns point at a trailing '' pad
+        width = len(header) + 1
+        col = {name: i for i, name in enumerate(header)}
+        (ci_title, ci_authors, ci_source_path, ci_year, ci_doi, ci_container, ci_journal,
+         ci_entry_type, ci_volume, ci_issue, ci_pages, ci_publisher, ci_isbn,
+         ci_source_title, ci_url, ci_abstract, ci_keywords) = (
+            col.get(name, width - 1) for name in (
+                'title', 'authors', 'source_path', 'year', 'doi', 'container', 'journal',
+                'entry_type', 'volume', 'issue', 'pages', 'publisher', 'isbn',
+                'source_title', 'url', 'abstract', 'keywords'))
+
+        def book_rows():
+            """Yield one INSERT tuple per CSV row, recording book_mapping as rows go by"""
+            nonlocal next_id
+            for row in reader:
+                if len(row) < width:
+                    row += [''] * (width - len(row))
+
+                # FINAL_BIBLIO_ATLANTA.csv has simple column names (no _out/_in suffix)
+                title = row[ci_title].strip()
+                authors = row[ci_authors].strip()
+                source_path = row[ci_source_path].strip()
+
+                # Skip empty rows
+                if not title and not source_path:
+                    continue
+
+                book_id = next_id
+                next_id += 1
+
+                # Extract relevant fields using FINAL_BIBLIO_ATLANTA.csv column names
+                yield (
+                    book_id,
+                    title,
+                    authors,
+                    _parse_year(row[ci_year]),
+                    row[ci_doi].strip(),
+                    row[ci_container].strip() or row[ci_journal].strip(),
+                    row[ci_entry_type].strip(),
+                    row[ci_volume].strip(),
+                    row[ci_issue].strip(),
+                    row[ci_pages].strip(),
+                    row[ci_publisher].strip(),
+                    row[ci_isbn].strip(),
+                    source_path,
+                    row[ci_source_title].strip(),
+                    authors,  # Use authors as meta_author fallback
+                    row[ci_url].strip(),
+                    '',  # domain_guess not in CSV
+                    row[ci_abstract].strip(),
+                    row[ci_keywords].strip(),
+                    0  # highlight_count is set by update_highlight_counts()
+                )
+
+                # Create mapping for linking with extracts using source_path
+                source_path = row[ci_source_path]
+                if source_path:
+                    # Extract filename from path for matching
+                    filename = Path(source_path).stem
+                    book_mapping[filename] = book_id
+
+                    # Also map by full path
+                    book_mapping[source_path] = book_id
+
+                # Also map by title for fallback matching
+                if title:
+                    book_mapping[title] = book_id
+
+        # Rows stream from the CSV straight into one prepared statement,
+        # committed as one transaction
+        conn.executemany(INSERT_BOOK_SQL, book_rows())
 
     conn.commit()
     print(f"Loaded {len(book_mapping)} books from bibliography")
@@ -176,6 +260,88 @@ def extract_filename_from_json(json_filename: str) -> str:
     """
     return json_filename.replace('_highlights.json', '').replace('_highlights', '')
 
+def _read_json(json_file: Path):
+    """Read and decode one highlights file; errors are returned so the caller reports them per file"""
+    try:
+        if orjson is not None:
+            with open(json_file, 'rb') as f:
+                return json_file, orjson.loads(f.read()), None
+        with open(json_file, 'r', encoding='utf-8') as f:
+            return json_file, json.load(f), None
+    except Exception as e:
+        return json_file, None, e
+
+def build_fallback_matcher(book_mapping: Dict[str, int]):
+    """
+    Build the Strategy 4 matcher for load_quotes.
+    Returns match(stem_lower, source_path_lower) -> book_id or None: the first
+    book_mapping key (in insertion order) that is contained in the stem or
+    source path, or that contains the stem, compared case-insensitively.
+    """
+    mapping_lower = [(book_key.lower(), mapped_id) for book_key, mapped_id in book_mapping.items()]
+
+    def scan_match(stem_lower: str, source_path_lower: str) -> Optional[int]:
+        for book_key_lower, mapped_id in mapping_lower:
+            # Try matching against various parts of the paths and titles
+            if (book_key_lower in stem_lower or
+                stem_lower in book_key_lower or
+                (source_path_lower and book_key_lower in source_path_lower)):
+                return mapped_id
+        return None
+
+    if ahocorasick is None:
+        return scan_match
+
+    # One automaton finds every key contained in a string in a single pass;
+    # each word maps to the position of its first key so order is preserved
+    automaton = ahocorasick.Automaton()
+    empty_key_index = None
+    for index, (book_key_lower, _) in enumerate(mapping_lower):
+        if not book_key_lower:
+            if empty_key_index is None:
+                empty_key_index = index
+        elif not automaton.exists(book_key_lower):
+            automaton.add_word(book_key_lower, index)
+    if not len(automaton):
+        return scan_match
+    automaton.make_automaton()
+
+    # Keys containing the stem are found with str.find over all keys joined
+    haystack = '\0'.join(book_key_lower for book_key_lower, _ in mapping_lower)
+    key_starts = []
+    offset = 0
+    for book_key_lower, _ in mapping_lower:
+        key_starts.append(offset)
+        offset += len(book_key_lower) + 1
+
+    def match(stem_lower: str, source_path_lower: str) -> Optional[int]:
+        if not stem_lower:
+            return mapping_lower[0][1]
+
+        candidates = [index for _, index in automaton.iter(stem_lower)]
+        if source_path_lower:
+            candidates.extend(index for _, index in automaton.iter(source_path_lower))
+        if empty_key_index is not None:
+            candidates.append(empty_key_index)
+
+        pos = haystack.find(stem_lower)
+        if pos != -1:
+            candidates.append(bisect_right(key_starts, pos) - 1)
+
+        return mapping_lower[min(candidates)][1] if candidates else None
+
+    return match
+
+INSERT_QUOTE_SQL = """
+INSERT INTO quotes (book_id, quote_text, page, keywords, source_file)
+VALUES (?, ?, ?, ?, ?)
+"""
+
+INSERT_PLACEHOLDER_BOOK_SQL = """
+INSERT INTO books (title, source_path)
+VALUES (?, ?)
+"""
+
 def load_quotes(conn: sqlite3.Connection, extracts_dir: str, book_mapping: Dict[str, int]):
     """
     Load quotes from JSON highlight files.
@@ -189,11 +355,21 @@ def load_quotes(conn: sqlite3.Connection, extracts_dir: str, book_mapping: Dict[
 
     quote_count = 0
     unknown_books = set()
+    cursor = conn.cursor()
+    json_files = list(Path(extracts_dir).glob("*_highlights.json"))
+
+    # Strategy 4 matcher over lowercased keys, built once for all files
+    fallback_match = build_fallback_matcher(book_mapping)
 
-    for json_file in Path(extracts_dir).glob("*_highlights.json"):
+    # Files are read and decoded on worker threads; all database writes stay on
+    # this thread with the one connection
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        decoded = list(executor.map(_read_json, json_files))
+
+    for json_file, data, read_error in decoded:
         try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                data = json.load(f)
+            if read_error:
+                raise read_error
 
             # Extract book identifier from filename or path in JSON
             json_stem = extract_filename_from_json(json_file.name)
@@ -218,87 +394,87 @@ def load_quotes(conn: sqlite3.Connection, extracts_dir: str, book_mapping: Dict[
 
             # Strategy 4: Fuzzy matching on available book titles and paths
             if not book_id:
-                for book_key, mapped_id in book_mapping.items():
-                    # Try matching against various parts of the paths and titles
-                    if (book_key.lower() in json_stem.lower() or
-                        json_stem.lower() in book_key.lower() or
-                        (json_source_path and book_key.lower() in json_source_path.lower())):
-                        book_id = mapped_id
-                        break
+                json_stem_lower = json_stem.lower()
+                source_path_lower = json_source_path.lower() if json_source_path else ''
+                book_id = fallback_match(json_stem_lower, source_path_lower)
 
             if not book_id:
                 # Create placeholder book entry for books not found in CSV
-                cursor = conn.cursor()
-
                 # Extract title from the file path in JSON if available
                 source_path = data.get('file', json_stem)
                 title = Path(source_path).stem if source_path else json_stem
 
-                cursor.execute("""
-                INSERT INTO books (title, source_path)
-                VALUES (?, ?)
-                """, (title, source_path))
+                cursor.execute(INSERT_PLACEHOLDER_BOOK_SQL, (title, source_path))
 
                 book_id = cursor.lastrowid
                 unknown_books.add(json_stem)
 
             # Load highlights/quotes
+            source_file = str(json_file)
+            quotes_batch = []
             highlights = data.get('highlights', [])
             for highlight in highlights:
                 quote_text = highlight.get('text', '').strip()
                 if quote_text:  # Skip empty quotes
                     page = highlight.get('page')
                     keywords = highlight.get('keywords', '')
+                    quotes_batch.append((book_id, quote_text, page, keywords, source_file))
 
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                    INSERT INTO quotes (book_id, quote_text, page, keywords, source_file)
-                    VALUES (?, ?, ?, ?, ?)
-                    """, (book_id, quote_text, page, keywords, str(json_file)))
-
-                    quote_count += 1
+            # One prepared statement per file; a bad file still fails on its own
+            cursor.executemany(INSERT_QUOTE_SQL, quotes_batch)
+            quote_count += len(quotes_batch)
 
         except Exception as e:
             print(f"Error processing {json_file}: {e}")
             continue
 
     conn.commit()
-    print(f"Loaded {quote_count} quotes from {len(list(Path(extracts_dir).glob('*_highlights.json')))} files")
+    print(f"Loaded {quote_count} quotes from {len(json_files)} files")
     if unknown_books:
         print(f"Warning: {len(unknown_books)} files had no bibliography match and were created as placeholder books")
 
-def rebuild_fts_index(conn: sqlite3.Connection):
-    """Rebuild FTS5 virtual table from quotes table with book metadata"""
-
-    # Always drop and recreate to ensure correct schema
-    conn.execute("DROP TABLE IF EXISTS quotes_fts")
+def update_highlight_counts(conn: sqlite3.Connection):
+    """Store each book's quote count in books.highlight_count so search doesn't aggregate quotes"""
     conn.execute("""
-    CREATE VIRTUAL TABLE quotes_fts USING fts5(
-        quote_text,
-        quote_keywords,
-        book_title,
-        book_authors,
-        book_keywords,
-        book_summary
+    UPDATE books SET highlight_count = (
+        SELECT COUNT(*) FROM quotes WHERE quotes.book_id = books.id
     )
     """)
+    conn.commit()
 
-    # Rebuild from quotes table with book metadata joined in
-    conn.execute("""
-    INSERT INTO quotes_fts(rowid, quote_text, quote_keywords, book_title, book_authors, book_keywords, book_summary)
-    SELECT
-        q.id,
-        q.quote_text,
-        COALESCE(q.keywords, ''),
-        COALESCE(b.title, ''),
-        COALESCE(b.authors, ''),
-        COALESCE(b.doc_keywords, ''),
-        COALESCE(b.doc_summary, '')
-    FROM quotes q
-    LEFT JOIN books b ON q.book_id = b.id
-    """)
+def rebuild_fts_index(conn: sqlite3.Connection):
+    """Rebuild FTS5 virtual table from quotes table with book metadata"""
+
+    # Always drop and recreate to ensure correct schema. The table stores its own
+    # copy of joined book fields (not external content), so FTS5's 'rebuild'
+    # command can't repopulate it; a single INSERT ... SELECT does instead.
+    # Drop, create and fill run as one transaction: a single commit, and readers
+    # never see a missing or half-filled index
+    conn.execute("BEGIN EXCLUSIVE")
+    try:
+        conn.execute("DROP TABLE IF EXISTS quotes_fts")
+        create_fts_table(conn)
+
+        # Rebuild from quotes table with book metadata joined in
+        conn.execute("""
+        INSERT INTO quotes_fts(rowid, quote_text, quote_keywords, book_title, book_authors, book_keywords, book_summary)
+        SELECT
+            q.id,
+            q.quote_text,
+            COALESCE(q.keywords, ''),
+            COALESCE(b.title, ''),
+            COALESCE(b.authors, ''),
+            COALESCE(b.doc_keywords, ''),
+            COALESCE(b.doc_summary, '')
+        FROM quotes q
+        LEFT JOIN books b ON q.book_id = b.id
+        """)
+
+        conn.commit()
+    except sqlite3.Error:
+        conn.rollback()
+        raise
 
-    conn.commit()
     print("Rebuilt FTS5 index with book metadata")
 
 def main():
@@ -336,12 +512,10 @@ def main():
         else:
             print("Building complete index...")
 
-            # Drop and recreate tables for fresh start
-            conn.execute("DROP TABLE IF EXISTS quotes_fts")
-            conn.execute("DROP TABLE IF EXISTS quotes")
-            conn.execute("DROP TABLE IF EXISTS books")
+            enter_bulk_mode(conn)
 
-            create_tables(conn)
+            # Drop and recreate tables for fresh start
+            conn.executescript(RESET_SCHEMA_SQL)
 
             # Load data - Use the actual CSV file that exists
             biblio_path = os.path.join(args.data_dir, "biblio", "FINAL_BIBLIO_ATLANTA.csv")
@@ -349,8 +523,11 @@ def main():
 
             book_mapping = load_bibliography(conn, biblio_path)
             load_quotes(conn, extracts_dir, book_mapping)
+            update_highlight_counts(conn)
             rebuild_fts_index(conn)
 
+            exit_bulk_mode(conn)
+
         # Add performance indexes
         print("\nAdding performance indexes...")
         cursor = conn.cursor()
@@ -363,6 +540,11 @@ def main():
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_entry_type ON books(entry_type)")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_quotes_page ON quotes(page)")
 
+        # Lookups by source file/title for linking extracts outside a full build;
+        # created here, after the bulk load, rather than maintained per insert
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_source_path ON books(source_path)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_books_title ON books(title)")
+
         conn.commit()
         print("  ✓ Performance indexes created")
 
@@ -371,6 +553,12 @@ def main():
         conn.commit()
         print("  ✓ Table statistics updated")
 
+        # Merge FTS5 segments so queries traverse a single segment
+        cursor.execute("INSERT INTO quotes_fts(quotes_fts) VALUES('optimize')")
+        cursor.execute("PRAGMA optimize")
+        conn.commit()
+        print("  ✓ FTS index optimized")
+
         # Final stats
         cursor.execute("SELECT COUNT(*) FROM books")
         book_count = cursor.fetchone()[0]
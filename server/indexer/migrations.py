@@ -5,6 +5,7 @@ Creates supporting tables for:
 - edits: Legacy/unused audit trail table
 - conflicts: CSV/JSON vs DB conflict detection
 - metadata: Tracking timestamps on books/quotes
+- highlight_count: Per-book quote counts used by search
 
 NOTE: User edits are written DIRECTLY to books/quotes tables,
 not to the edits table.
@@ -84,7 +85,10 @@ def add_metadata_columns(conn: sqlite3.Connection):
     """
     Add metadata tracking columns to books and quotes tables.
     Tracks when records were last modified in DB vs source files.
+    All column additions and backfills run in one write transaction.
     """
+    conn.execute("BEGIN IMMEDIATE")
+
     # Check if columns already exist
     cursor = conn.cursor()
     cursor.execute("PRAGMA table_info(books)")
@@ -129,6 +133,20 @@ def add_metadata_columns(conn: sqlite3.Connection):
     conn.commit()
 
 
+def backfill_highlight_counts(conn: sqlite3.Connection):
+    """
+    Populate books.highlight_count for databases indexed before it was maintained.
+    Search reads this column instead of counting quotes per request.
+    """
+    conn.execute("""
+    UPDATE books SET highlight_count = (
+        SELECT COUNT(*) FROM quotes WHERE quotes.book_id = books.id
+    )
+    """)
+    conn.commit()
+    print("✓ Backfilled books.highlight_count")
+
+
 def migrate_database(db_path: str):
     """
     Run all migrations on the database.
@@ -145,6 +163,7 @@ def migrate_database(db_path: str):
         create_edits_table(conn)
         create_conflicts_table(conn)
         add_metadata_columns(conn)
+        backfill_highlight_counts(conn)
 
         print("\n✅ All migrations completed successfully")
 
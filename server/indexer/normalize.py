@@ -4,29 +4,70 @@ Text normalization utilities for The Library indexer.
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import List
 
+# Patterns compiled once at import rather than looked up per call
+_WS_RE = re.compile(r'\s+')
+_QUOTE_STRIP_RE = re.compile(r'[^\w\s\'".,;:!?()-]')
+_EDGE_PUNCT = '.,;:!?()-'
+
+# ASCII characters _QUOTE_STRIP_RE removes, as a str.translate deletion table
+_QUOTE_STRIP_ASCII = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i) == '_' or chr(i).isspace() or chr(i) in '\'".,;:!?()-')
+}
+_FNAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+_WORD_RE = re.compile(r'\b[a-zA-Z]{3,}\b')
+
+# Common words skipped by extract_keywords
+_STOP_WORDS = frozenset({
+    'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
+    'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
+    'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
+    'could', 'can', 'may', 'might', 'must', 'shall', 'this', 'that',
+    'these', 'those', 'from', 'up', 'down', 'out', 'off', 'over', 'under',
+    'into', 'onto', 'through', 'during', 'before', 'after', 'above',
+    'below', 'between', 'among', 'around', 'about', 'as', 'like'
+})
+
+# Only short strings (headings, containers, titles) repeat often enough to be
+# worth caching; longer inputs bypass the result caches to bound their memory
+_CACHEABLE_LEN = 256
+
 def normalize_text(text: str) -> str:
     """
     Normalize text for search indexing.
     - Remove excessive whitespace
     - Normalize Unicode characters
     - Preserve essential punctuation for quotes
+    Results are cached, since reindexing repeats identical strings.
     """
+    if text and len(text) > _CACHEABLE_LEN:
+        return _normalize_text(text)
+    return _normalize_text_cached(text)
+
+def _normalize_text(text: str) -> str:
     if not text:
         return ""
 
-    # Normalize Unicode to composed form
-    text = unicodedata.normalize('NFC', text)
+    # Normalize Unicode to composed form (ASCII text is already NFC)
+    if not text.isascii():
+        text = unicodedata.normalize('NFC', text)
 
-    # Replace multiple whitespace with single space
-    text = re.sub(r'\s+', ' ', text)
+    # Replace multiple whitespace with single space. Printable text contains
+    # no whitespace other than ' ', so without a double space there is
+    # nothing to collapse and only the ends need stripping
+    if '  ' in text or not text.isprintable():
+        text = _WS_RE.sub(' ', text)
 
     # Strip leading/trailing whitespace
     text = text.strip()
 
     return text
 
+_normalize_text_cached = lru_cache(maxsize=8192)(_normalize_text)
+
 def extract_keywords(text: str) -> List[str]:
     """
     Extract meaningful keywords from text.
@@ -37,36 +78,32 @@ def extract_keywords(text: str) -> List[str]:
 
     # Simple keyword extraction
     # Remove common stop words and extract meaningful terms
-    stop_words = {
-        'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for',
-        'of', 'with', 'by', 'is', 'are', 'was', 'were', 'be', 'been', 'being',
-        'have', 'has', 'had', 'do', 'does', 'did', 'will', 'would', 'should',
-        'could', 'can', 'may', 'might', 'must', 'shall', 'this', 'that',
-        'these', 'those', 'from', 'up', 'down', 'out', 'off', 'over', 'under',
-        'into', 'onto', 'through', 'during', 'before', 'after', 'above',
-        'below', 'between', 'among', 'around', 'about', 'as', 'like'
-    }
-
-    # Extract words (3+ characters)
-    words = re.findall(r'\b[a-zA-Z]{3,}\b', text.lower())
-
-    # Filter out stop words
-    keywords = [word for word in words if word not in stop_words]
-
-    # Remove duplicates while preserving order
-    seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        if keyword not in seen:
-            seen.add(keyword)
-            unique_keywords.append(keyword)
-
-    return unique_keywords[:20]  # Limit to 20 keywords
+    # Extract words (3+ characters) in one pass: skip stop words, dedupe via
+    # dict insertion order, and stop once 20 keywords are found.
+    # ASCII text is matched as-is and each word lowercased, avoiding a full
+    # copy; other text is lowered first, since lower() can turn non-ASCII
+    # letters into ASCII ones (e.g. the Kelvin sign)
+    unique_keywords = {}
+    for match in _WORD_RE.finditer(text if text.isascii() else text.lower()):
+        word = match.group().lower()
+        if word in _STOP_WORDS or word in unique_keywords:
+            continue
+        unique_keywords[word] = None
+        if len(unique_keywords) == 20:  # Limit to 20 keywords
+            break
+
+    return list(unique_keywords)
 
 def clean_quote_text(quote: str) -> str:
     """
     Clean quote text while preserving meaning and searchability.
+    Results are cached like normalize_text.
     """
+    if quote and len(quote) > _CACHEABLE_LEN:
+        return _clean_quote_text(quote)
+    return _clean_quote_text_cached(quote)
+
+def _clean_quote_text(quote: str) -> str:
     if not quote:
         return ""
 
@@ -74,14 +111,20 @@ def clean_quote_text(quote: str) -> str:
     quote = normalize_text(quote)
 
     # Remove excessive punctuation but preserve essential quotes and periods
-    quote = re.sub(r'[^\w\s\'".,;:!?()-]', '', quote)
+    # (one C-level table pass for ASCII text; the regex handles the rest)
+    if quote.isascii():
+        quote = quote.translate(_QUOTE_STRIP_ASCII)
+    else:
+        quote = _QUOTE_STRIP_RE.sub('', quote)
 
     # Ensure quotes don't start/end with punctuation (except quotes)
-    quote = re.sub(r'^[.,;:!?()-]+', '', quote)
-    quote = re.sub(r'[.,;:!?()-]+$', '', quote)
+    quote = quote.lstrip(_EDGE_PUNCT).rstrip(_EDGE_PUNCT)
 
     return quote.strip()
 
+_clean_quote_text_cached = lru_cache(maxsize=8192)(_clean_quote_text)
+
+@lru_cache(maxsize=8192)
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe processing.
@@ -90,9 +133,9 @@ def sanitize_filename(filename: str) -> str:
         return ""
 
     # Remove or replace problematic characters
-    filename = re.sub(r'[<>:"/\\|?*]', '_', filename)
+    filename = filename.translate(_FNAME_TABLE)
 
     # Remove excessive spaces
-    filename = re.sub(r'\s+', ' ', filename)
+    filename = _WS_RE.sub(' ', filename)
 
     return filename.strip()
\ No newline at end of file
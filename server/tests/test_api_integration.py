@@ -1,16 +1,16 @@
 """Integration tests for The Library API"""
 import pytest
 import sqlite3
-import tempfile
+import shutil
 import os
 from fastapi.testclient import TestClient
 from api.main import app
 
 
-@pytest.fixture
-def test_db_with_data():
-    """Create a test database with sample data"""
-    fd, path = tempfile.mkstemp(suffix='.db')
+@pytest.fixture(scope='session')
+def template_db(tmp_path_factory):
+    """Build the sample database once per session; tests get their own copy"""
+    path = str(tmp_path_factory.mktemp('template') / 'library.db')
     conn = sqlite3.connect(path)
 
     # Create full schema
@@ -70,15 +70,22 @@ def test_db_with_data():
             (3, 2, 'Making is a form of thinking', 5, 'craft, cognition')
     """)
 
-    # Populate FTS
-    conn.execute("""
-        INSERT INTO quotes_fts (rowid, quote_text, keywords)
-        SELECT id, quote_text, keywords FROM quotes
-    """)
+    # Populate FTS from its content table in one pass, then merge to a single segment
+    conn.execute("INSERT INTO quotes_fts(quotes_fts) VALUES('rebuild')")
+    conn.execute("INSERT INTO quotes_fts(quotes_fts) VALUES('optimize')")
 
     conn.commit()
     conn.close()
 
+    return path
+
+
+@pytest.fixture
+def test_db_with_data(template_db, tmp_path):
+    """Create a test database with sample data"""
+    path = str(tmp_path / 'library.db')
+    shutil.copyfile(template_db, path)
+
     # Store original DB path and swap
     original_db = os.environ.get('TEST_DB_PATH')
     os.environ['TEST_DB_PATH'] = path
@@ -91,9 +98,6 @@ def test_db_with_data():
     else:
         os.environ.pop('TEST_DB_PATH', None)
 
-    os.close(fd)
-    os.unlink(path)
-
 
 @pytest.fixture
 def client():
@@ -124,6 +124,51 @@ def test_editor_save_multiple_edits(test_db):
     assert row[2] == 2025
 
 
+def test_editor_coerces_numeric_strings(test_db):
+    """Test that numeric strings are stored as integers for integer fields"""
+    editor = EditorService(test_db)
+
+    result = editor.save_edit(
+        entity_type='book',
+        entity_id=1,
+        field_name='year',
+        new_value='1999'
+    )
+
+    assert result['new_value'] == 1999
+
+    result = editor.save_edit(
+        entity_type='book',
+        entity_id=1,
+        field_name='title',
+        new_value='1999'
+    )
+
+    assert result['new_value'] == '1999'
+
+
+def test_editor_skips_unchanged_values(test_db):
+    """Test that edits matching the stored value are reported as no-ops"""
+    editor = EditorService(test_db)
+
+    result = editor.save_edit(
+        entity_type='book',
+        entity_id=1,
+        field_name='title',
+        new_value='Test Book'
+    )
+
+    assert result['status'] == 'unchanged'
+
+    results = editor.save_multiple_edits(
+        entity_type='book',
+        entity_id=1,
+        updates={'title': 'Test Book', 'authors': 'Someone Else'}
+    )
+
+    assert [r['status'] for r in results] == ['unchanged', 'success']
+
+
 def test_editor_field_whitelist_book(test_db):
     """Test that invalid book fields are rejected"""
     editor = EditorService(test_db)
@@ -0,0 +1,127 @@
+"""Tests for scorer service"""
+import pytest
+import sqlite3
+import tempfile
+import os
+from api.services.scorer import QuoteScorer
+from api.models.scoring_config import ScoringConfig, FieldWeights
+from indexer.build_index import create_tables, update_highlight_counts, rebuild_fts_index
+
+
+BOOKS = [
+    (1, 'Alpha', 'Author One', 2001, 'Press One'),
+    (2, 'Beta', 'Author Two', 2002, 'Press Two'),
+    (3, 'Gamma', 'Author Three', 2003, 'Press Three'),
+    (4, 'Labyrinth', 'Author Four', 2004, 'Press Four'),
+    (5, 'Delta', 'Author Five', 2005, 'Press Five'),
+]
+
+QUOTES = [
+    (1, 1, 'memory memory memory and forgetting', 1),
+    (2, 1, 'memory of places', 2),
+    (3, 1, 'a palace of memory and images', 3),
+    (4, 2, 'memory is a kind of reading', 10),
+    (5, 2, 'the slow work of memory over the long years', 11),
+    (6, 3, 'notes on memory, written down late in a long and crowded life', 20),
+    (7, 3, 'an unrelated passage about rivers', 21),
+    (8, 4, 'walls and corridors without end', 30),
+    (9, 5, 'a labyrinth of narrow streets', 40),
+]
+
+
+@pytest.fixture
+def test_db():
+    """Create a temporary database with the indexer's schema and FTS table"""
+    fd, path = tempfile.mkstemp(suffix='.db')
+    conn = sqlite3.connect(path)
+    create_tables(conn)
+
+    conn.executemany(
+        "INSERT INTO books (id, title, authors, year, publisher) VALUES (?, ?, ?, ?, ?)", BOOKS
+    )
+    conn.executemany(
+        "INSERT INTO quotes (id, book_id, quote_text, page) VALUES (?, ?, ?, ?)", QUOTES
+    )
+    conn.commit()
+    update_highlight_counts(conn)
+    rebuild_fts_index(conn)
+    conn.close()
+
+    yield path
+
+    # Cleanup
+    os.close(fd)
+    os.unlink(path)
+
+
+def test_search_page_is_hydrated(test_db):
+    """Pages past the first carry book metadata, book quote counts and quote text"""
+    scorer = QuoteScorer()
+    full = scorer.search_and_score(test_db, 'memory', offset=0, limit=10)
+    assert full['total'] == 3
+
+    page = QuoteScorer().search_and_score(test_db, 'memory', offset=1, limit=1)
+    assert page['total'] == 3
+    assert len(page['results']) == 1
+
+    result = page['results'][0]
+    expected = full['results'][1]
+    assert result['book']['id'] == expected['book']['id']
+    assert result['book']['title'] == expected['book']['title']
+    assert result['book']['authors'] == expected['book']['authors']
+
+    quote_counts = {1: 3, 2: 2, 3: 2}
+    assert result['total_book_quotes'] == quote_counts[result['book']['id']]
+    assert result['top_quotes']
+    for quote in result['top_quotes']:
+        assert quote['quote_text'] == QUOTES[quote['id'] - 1][2]
+
+
+def test_cached_page_matches_first_response(test_db):
+    """Asking for the same page again is served from the cache with the same result"""
+    scorer = QuoteScorer()
+    first = scorer.search_and_score(test_db, 'memory', offset=1, limit=2)
+    assert len(scorer._result_cache) == 1
+
+    second = scorer.search_and_score(test_db, 'memory', offset=1, limit=2)
+    assert len(scorer._result_cache) == 1
+    assert second == first
+
+    for result in second['results']:
+        assert result['book'] is not None
+        assert result['total_book_quotes'] > 0
+        assert all(quote['quote_text'] for quote in result['top_quotes'])
+
+
+def test_title_weight_changes_ordering(test_db):
+    """The book_title weight is applied as a bm25 column weight and can reorder results"""
+    scorer = QuoteScorer()
+
+    # 'labyrinth' is in book 4's title only and in book 5's quote text only
+    scorer.update_config(ScoringConfig(field_weights=FieldWeights(book_title=0.0)))
+    untitled = scorer.search_with_breakdown(test_db, 'labyrinth')
+    assert [r['book']['id'] for r in untitled['results']] == [5, 4]
+
+    scorer.update_config(ScoringConfig(field_weights=FieldWeights(book_title=10.0)))
+    titled = scorer.search_with_breakdown(test_db, 'labyrinth')
+    assert [r['book']['id'] for r in titled['results']] == [4, 5]
+    assert titled['results'][0]['top_quotes'][0]['score'] > titled['results'][1]['top_quotes'][0]['score']
+
+
+def test_cache_is_keyed_on_scoring_config(test_db):
+    """Switching configs keeps earlier rankings cached instead of clearing them"""
+    scorer = QuoteScorer()
+    default = ScoringConfig()
+    weighted = ScoringConfig(field_weights=FieldWeights(book_title=10.0))
+
+    scorer.update_config(default)
+    first = scorer.search_with_breakdown(test_db, 'labyrinth')
+
+    scorer.update_config(weighted)
+    scorer.search_with_breakdown(test_db, 'labyrinth')
+    assert len(scorer._result_cache) == 2
+
+    scorer.update_config(default)
+    again = scorer.search_with_breakdown(test_db, 'labyrinth')
+    assert len(scorer._result_cache) == 2
+    assert again == first
@@ -4,32 +4,81 @@ Script to translate French fields in the bibliography CSV to English.
 Translates summary, keywords, and theme fields from French to English.
 """
 
+import os
 import pandas as pd
 import re
+import torch
 import unicodedata
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 from transformers import MarianMTModel, MarianTokenizer
 
+try:
+    import ctranslate2
+except ImportError:
+    ctranslate2 = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 # Initialize translation model (best French-English model)
 model_name = "Helsinki-NLP/opus-mt-fr-en"
 model = None
 tokenizer = None
+device = "cpu"
+
+# Optional CTranslate2 copy of the same model (int8, native kernels), used instead
+# of transformers when ctranslate2 is installed and the directory exists. Create it with:
+#   ct2-transformers-converter --model Helsinki-NLP/opus-mt-fr-en --output_dir opus-mt-fr-en-ct2 --quantization int8
+ct2_model_dir = os.environ.get("OPUS_MT_CT2_DIR", "opus-mt-fr-en-ct2")
+translator = None
+
+# Local safetensors copy of the model, written on the first run so later runs
+# load it directly instead of going through the hub download/cache
+local_model_dir = os.environ.get("OPUS_MT_LOCAL_DIR", "opus-mt-fr-en")
 
 def init_translation_model():
     """Initialize the translation model (lazy loading)"""
-    global model, tokenizer
-    if model is None:
+    global model, tokenizer, device, translator
+    if model is None and translator is None:
         print("Loading French-English translation model...")
-        tokenizer = MarianTokenizer.from_pretrained(model_name)
-        model = MarianMTModel.from_pretrained(model_name)
+        have_local_copy = Path(local_model_dir).is_dir()
+        tokenizer = MarianTokenizer.from_pretrained(local_model_dir if have_local_copy else model_name)
+        if ctranslate2 is not None and Path(ct2_model_dir).is_dir():
+            ct2_device = "cuda" if ctranslate2.get_cuda_device_count() else "cpu"
+            translator = ctranslate2.Translator(
+                ct2_model_dir, device=ct2_device, compute_type="int8", intra_threads=os.cpu_count() or 0
+            )
+            print(f"Translation model loaded successfully! (CTranslate2, {ct2_device})")
+            return
+        # fp16 on GPU halves weight/activation traffic and runs on tensor cores;
+        # CPUs mostly lack native bf16/fp16 kernels, so inference stays fp32 there
+        if torch.cuda.is_available():
+            device = "cuda"
+        dtype = torch.float16 if device == "cuda" else torch.float32
+        if have_local_copy:
+            # Loads straight into the target precision (half the RAM on GPU)
+            model = MarianMTModel.from_pretrained(local_model_dir, torch_dtype=dtype)
+        else:
+            model = MarianMTModel.from_pretrained(model_name)
+            # Saved before any cast so CPU runs keep the original fp32 weights
+            model.save_pretrained(local_model_dir, safe_serialization=True)
+            tokenizer.save_pretrained(local_model_dir)
+        model = model.to(device=device, dtype=dtype)
+        model.eval()
         print("Translation model loaded successfully!")
 
 translation_counter = 0
 
-def translate_with_model(text: str) -> str:
-    """Translate text using the neural translation model"""
-    global translation_counter
+# (num_beams, chunk) -> translated chunk, so a sentence repeated anywhere in the
+# run (boilerplate, multi-volume summaries) only goes through the model once
+_translation_cache = {}
 
+def translate_with_model(text: str, num_beams: int = 1) -> str:
+    """Translate text using the neural translation model"""
     if not text or pd.isna(text):
         return text
 
@@ -37,56 +86,147 @@ def translate_with_model(text: str) -> str:
     if is_mostly_english(text):
         return text
 
-    try:
-        translation_counter += 1
-        print(f"\n[Translation #{translation_counter}]")
-        print(f"  Original: {text[:150]}..." if len(str(text)) > 150 else f"  Original: {text}")
+    return translate_batch([text], num_beams=num_beams)[0]
+
+def _generate_batch(batch: list, num_beams: int) -> list:
+    """Translate one mini-batch of chunks with whichever backend was loaded."""
+    if translator is not None:
+        # CTranslate2 works on SentencePiece tokens rather than id tensors
+        source = [
+            tokenizer.convert_ids_to_tokens(tokenizer.encode(chunk, truncation=True, max_length=512))
+            for chunk in batch
+        ]
+        results = translator.translate_batch(source, beam_size=num_beams, max_decoding_length=512)
+        return [
+            tokenizer.decode(tokenizer.convert_tokens_to_ids(result.hypotheses[0]), skip_special_tokens=True)
+            for result in results
+        ]
+
+    inputs = tokenizer(batch, return_tensors="pt", padding=True, truncation=True, max_length=512).to(device)
+    with torch.inference_mode():
+        translated = model.generate(
+            **inputs, max_length=512, num_beams=num_beams, do_sample=False, early_stopping=num_beams > 1
+        )
+    return tokenizer.batch_decode(translated, skip_special_tokens=True)
+
+def translate_batch(texts: list, batch_size: int = 32, num_beams: int = 1) -> list:
+    """
+    Translate a list of texts with the neural model, batching generate() calls.
+
+    Every text is split into chunks as before; the distinct chunks of all texts
+    that are not cached yet are sorted by length, tokenized with padding and
+    translated together, batch_size at a time, then re-joined per text in their
+    original order. Texts whose translation fails are returned unchanged.
 
-        # Split long text into chunks to avoid model limits
-        chunks = split_text_into_chunks(text, max_length=400)
-        translated_chunks = []
+    Decoding is greedy by default (num_beams=1), which is several times cheaper
+    than beam search and good enough for summaries; pass num_beams=2 or more
+    where fluency matters more than throughput.
+    """
+    global translation_counter
 
-        for chunk in chunks:
+    # Flatten the non-empty chunks of every text, remembering which text each came from
+    pieces = []
+    owners = []
+    for i, text in enumerate(texts):
+        for chunk in split_text_into_chunks(text, max_length=400):
             if chunk.strip():
-                # Tokenize and translate
-                inputs = tokenizer(chunk, return_tensors="pt", padding=True, truncation=True, max_length=512)
-                translated = model.generate(**inputs, max_length=512, num_beams=4, early_stopping=True)
-                translated_text = tokenizer.decode(translated[0], skip_special_tokens=True)
-                translated_chunks.append(translated_text)
+                pieces.append(chunk)
+                owners.append(i)
+
+    # Only distinct chunks not translated earlier in the run go to the model,
+    # batched with chunks of similar length so little of each batch is padding
+    pending = sorted(
+        dict.fromkeys(chunk for chunk in pieces if (num_beams, chunk) not in _translation_cache),
+        key=len, reverse=True
+    )
+
+    for start in range(0, len(pending), batch_size):
+        batch = pending[start:start + batch_size]
+        try:
+            for chunk, piece in zip(batch, _generate_batch(batch, num_beams)):
+                _translation_cache[num_beams, chunk] = piece
+        except Exception as e:
+            print(f"Translation error: {e}")
+
+    translated_pieces = [_translation_cache.get((num_beams, chunk)) for chunk in pieces]
+
+    # Re-join chunks per text; a text with any failed chunk keeps its original
+    joined = [[] for _ in texts]
+    failed = set()
+    for owner, piece in zip(owners, translated_pieces):
+        if piece is None:
+            failed.add(owner)
+        else:
+            joined[owner].append(piece)
+
+    results = []
+    for i, text in enumerate(texts):
+        if i in failed:
+            results.append(text)
+            continue
 
-        result = " ".join(translated_chunks)
+        result = " ".join(joined[i])
+        translation_counter += 1
+        print(f"\n[Translation #{translation_counter}]")
+        print(f"  Original: {text[:150]}..." if len(str(text)) > 150 else f"  Original: {text}")
         print(f"  → Translated: {result[:150]}..." if len(result) > 150 else f"  → Translated: {result}")
-        return result
-    except Exception as e:
-        print(f"Translation error: {e}")
-        return text
+        results.append(result)
+
+    return results
+
+# Expanded list of French indicators including more common words and accented characters
+FRENCH_INDICATORS = [
+    'le ', 'la ', 'les ', 'du ', 'de la ', 'des ', 'ce ', 'cette ', 'ces ',
+    'est ', 'sont ', 'dans ', 'sur ', 'avec ', 'pour ', 'par ', 'qui ', 'que ',
+    'dont ', 'où ', 'à ', 'été ', 'être ', 'avoir ', 'faire ', 'dit ', 'fait ',
+    'très ', 'bien ', 'peu ', 'même ', 'autre ', 'aussi ', 'leur ', 'tout ',
+    'nous ', 'vous ', 'mais ', 'ou ', 'et ', 'donc ', 'car ', 'ni ', 'ne ',
+    'créativité', 'artificielle', 'effondrement', 'réseau', 'système', 'développement',
+    'étude', 'recherche', 'année', 'société', 'économie', 'politique'
+]
+
+# Also check for French accented characters
+FRENCH_ACCENTS = ['é', 'è', 'ê', 'ë', 'à', 'â', 'ù', 'û', 'ü', 'ô', 'î', 'ï', 'ç', 'œ', 'æ']
+
+# Fallback when pyahocorasick is missing: one regex scan per check instead of
+# one substring search per indicator
+_FRENCH_INDICATOR_RE = re.compile('|'.join(re.escape(indicator) for indicator in FRENCH_INDICATORS))
+_FRENCH_ACCENT_RE = re.compile('[' + ''.join(FRENCH_ACCENTS) + ']')
+
+def _build_french_automaton():
+    """Aho-Corasick automaton over indicators and accents (None without pyahocorasick)."""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    # Indicators are added last so they win if a string is in both lists
+    for accent in FRENCH_ACCENTS:
+        automaton.add_word(accent, (False, accent))
+    for indicator in FRENCH_INDICATORS:
+        automaton.add_word(indicator, (True, indicator))
+    automaton.make_automaton()
+    return automaton
+
+# Finds every indicator and accent in one linear pass, however long the lists grow
+_FRENCH_AUTOMATON = _build_french_automaton()
 
 def is_mostly_english(text: str) -> bool:
     """Check if text is mostly English based on common French indicators"""
-    # Expanded list of French indicators including more common words and accented characters
-    french_indicators = [
-        'le ', 'la ', 'les ', 'du ', 'de la ', 'des ', 'ce ', 'cette ', 'ces ',
-        'est ', 'sont ', 'dans ', 'sur ', 'avec ', 'pour ', 'par ', 'qui ', 'que ',
-        'dont ', 'où ', 'à ', 'été ', 'être ', 'avoir ', 'faire ', 'dit ', 'fait ',
-        'très ', 'bien ', 'peu ', 'même ', 'autre ', 'aussi ', 'leur ', 'tout ',
-        'nous ', 'vous ', 'mais ', 'ou ', 'et ', 'donc ', 'car ', 'ni ', 'ne ',
-        'créativité', 'artificielle', 'effondrement', 'réseau', 'système', 'développement',
-        'étude', 'recherche', 'année', 'société', 'économie', 'politique'
-    ]
-
-    # Also check for French accented characters
-    french_accents = ['é', 'è', 'ê', 'ë', 'à', 'â', 'ù', 'û', 'ü', 'ô', 'î', 'ï', 'ç', 'œ', 'æ']
-
     text_lower = text.lower()
 
-    # Count French indicators
-    french_count = sum(1 for indicator in french_indicators if indicator in text_lower)
+    # More aggressive detection: if ANY French indicators or multiple accented chars, translate it
+    if _FRENCH_AUTOMATON is not None:
+        accents = set()
+        for _, (is_indicator, word) in _FRENCH_AUTOMATON.iter(text_lower):
+            if is_indicator:
+                return False
+            accents.add(word)
+        return len(accents) < 2
 
-    # Count French accented characters
-    accent_count = sum(1 for accent in french_accents if accent in text_lower)
+    if _FRENCH_INDICATOR_RE.search(text_lower):
+        return False
+    return len(set(_FRENCH_ACCENT_RE.findall(text_lower))) < 2
 
-    # More aggressive detection: if ANY French indicators or multiple accented chars, translate it
-    return french_count == 0 and accent_count < 2
+_SENTENCE_SPLIT = re.compile(r'[.!?]+')
 
 def split_text_into_chunks(text: str, max_length: int = 400) -> list:
     """Split text into smaller chunks for translation"""
@@ -94,7 +234,7 @@ def split_text_into_chunks(text: str, max_length: int = 400) -> list:
         return [text]
 
     # Try to split at sentence boundaries
-    sentences = re.split(r'[.!?]+', text)
+    sentences = _SENTENCE_SPLIT.split(text)
     chunks = []
     current_chunk = ""
 
@@ -111,6 +251,303 @@ def split_text_into_chunks(text: str, max_length: int = 400) -> list:
 
     return chunks
 
+# Common French to English translations for academic/technical content
+TRANSLATIONS = {
+    # Academic terms
+    "résumé": "summary",
+    "mots-clés": "keywords",
+    "mots clés": "keywords",
+    "références bibliographiques": "bibliographic references",
+    "références": "references",
+    "auteur": "author",
+    "titre": "title",
+    "année": "year",
+    "éditeur": "publisher",
+    "chapitre": "chapter",
+    "ouvrage": "work",
+    "document": "document",
+    "étude": "study",
+    "recherche": "research",
+    "analyse": "analysis",
+    "thèse": "thesis",
+    "article": "article",
+    "livre": "book",
+    "revue": "journal",
+    "écritures": "writings",
+    "écriture": "writing",
+
+    # Technology terms
+    "intelligence artificielle": "artificial intelligence",
+    "réseaux sans fil": "wireless networks",
+    "technologie": "technology",
+    "informatique": "computer science",
+    "numérique": "digital",
+    "électronique": "electronic",
+    "logiciel": "software",
+    "matériel": "hardware",
+    "système": "system",
+    "algorithme": "algorithm",
+    "données": "data",
+    "base de données": "database",
+    "réseau": "network",
+    "internet": "internet",
+    "web": "web",
+    "site web": "website",
+    "application": "application",
+    "programme": "program",
+    "programmation": "programming",
+    "développement": "development",
+    "innovation": "innovation",
+    "évolution": "evolution",
+    "transformation": "transformation",
+    "automatisation": "automation",
+    "robotique": "robotics",
+    "cybernétique": "cybernetics",
+
+    # Science terms
+    "sciences": "sciences",
+    "physique": "physics",
+    "chimie": "chemistry",
+    "biologie": "biology",
+    "mathématiques": "mathematics",
+    "géologie": "geology",
+    "astronomie": "astronomy",
+    "médecine": "medicine",
+    "psychologie": "psychology",
+    "sociologie": "sociology",
+    "anthropologie": "anthropology",
+    "philosophie": "philosophy",
+    "histoire": "history",
+    "géographie": "geography",
+    "économie": "economics",
+    "politique": "politics",
+    "droit": "law",
+    "éducation": "education",
+    "enseignement": "teaching",
+    "apprentissage": "learning",
+    "formation": "training",
+    "université": "university",
+    "école": "school",
+    "institut": "institute",
+    "laboratoire": "laboratory",
+    "centre": "center",
+    "département": "department",
+    "faculté": "faculty",
+
+    # Art and culture terms
+    "art": "art",
+    "culture": "culture",
+    "littérature": "literature",
+    "musique": "music",
+    "peinture": "painting",
+    "sculpture": "sculpture",
+    "architecture": "architecture",
+    "théâtre": "theater",
+    "cinéma": "cinema",
+    "film": "film",
+    "photographie": "photography",
+    "design": "design",
+    "esthétique": "aesthetics",
+    "créativité": "creativity",
+    "artistique": "artistic",
+    "culturel": "cultural",
+    "patrimonial": "heritage",
+    "traditionnel": "traditional",
+    "moderne": "modern",
+    "contemporain": "contemporary",
+
+    # Media and communication
+    "médias": "media",
+    "communication": "communication",
+    "information": "information",
+    "journalisme": "journalism",
+    "presse": "press",
+    "radio": "radio",
+    "télévision": "television",
+    "diffusion": "broadcasting",
+    "publication": "publication",
+    "édition": "publishing",
+    "impression": "printing",
+
+    # Social and political terms
+    "société": "society",
+    "social": "social",
+    "public": "public",
+    "privé": "private",
+    "gouvernement": "government",
+    "administration": "administration",
+    "gestion": "management",
+    "organisation": "organization",
+    "institution": "institution",
+    "entreprise": "enterprise",
+    "industrie": "industry",
+    "commerce": "commerce",
+    "marché": "market",
+    "économique": "economic",
+    "financier": "financial",
+    "commercial": "commercial",
+    "industriel": "industrial",
+
+    # Time and space
+    "futur": "future",
+    "avenir": "future",
+    "présent": "present",
+    "passé": "past",
+    "historique": "historical",
+    "actuel": "current",
+    "nouveau": "new",
+    "ancien": "old",
+    "récent": "recent",
+    "moderne": "modern",
+    "traditionnel": "traditional",
+    "global": "global",
+    "international": "international",
+    "national": "national",
+    "régional": "regional",
+    "local": "local",
+
+    # Adjectives and descriptors
+    "important": "important",
+    "principal": "main",
+    "majeur": "major",
+    "mineur": "minor",
+    "central": "central",
+    "essentiel": "essential",
+    "nécessaire": "necessary",
+    "possible": "possible",
+    "difficile": "difficult",
+    "facile": "easy",
+    "complexe": "complex",
+    "simple": "simple",
+    "avancé": "advanced",
+    "basique": "basic",
+    "général": "general",
+    "spécifique": "specific",
+    "particulier": "particular",
+    "spécialisé": "specialized",
+
+    # Specific phrases found in the CSV
+    "enseignement supérieur artistique": "artistic higher education",
+    "révolution industrielle": "industrial revolution",
+    "changement climatique": "climate change",
+    "réalité virtuelle": "virtual reality",
+    "réalité augmentée": "augmented reality",
+    "apprentissage à distance": "distance learning",
+    "sciences cognitives": "cognitive sciences",
+    "nanotechnologies": "nanotechnologies",
+    "biotechnologies": "biotechnologies",
+    "interface cerveau-machine": "brain-machine interface",
+    "convergence technologique": "technological convergence",
+    "quatrième révolution industrielle": "fourth industrial revolution",
+
+    # Additional terms with accents and capitals
+    "créativité": "creativity",
+    "créative": "creative",
+    "créatif": "creative",
+    "créateurs": "creators",
+    "créateur": "creator",
+    "académique": "academic",
+    "académiques": "academic",
+    "économique": "economic",
+    "économiques": "economic",
+    "technologique": "technological",
+    "technologiques": "technological",
+    "industrielle": "industrial",
+    "industrielles": "industrial",
+    "culturelle": "cultural",
+    "culturelles": "cultural",
+    "scientifique": "scientific",
+    "scientifiques": "scientific",
+    "artistique": "artistic",
+    "artistiques": "artistic",
+    "éthique": "ethics",
+    "éthiques": "ethical",
+    "esthétique": "aesthetic",
+    "esthétiques": "aesthetic",
+    "théorie": "theory",
+    "théories": "theories",
+    "théorique": "theoretical",
+    "théoriques": "theoretical",
+    "pratique": "practice",
+    "pratiques": "practices",
+    "méthodologie": "methodology",
+    "méthodologies": "methodologies",
+    "pédagogie": "pedagogy",
+    "pédagogique": "pedagogical",
+    "pédagogiques": "pedagogical",
+    "didactique": "didactic",
+    "didactiques": "didactic",
+    "numérique": "digital",
+    "numériques": "digital",
+    "électronique": "electronic",
+    "électroniques": "electronic",
+    "mémoire": "memory",
+    "mémoires": "memories",
+    "société": "society",
+    "sociétés": "societies",
+    "sociétal": "societal",
+    "sociétaux": "societal",
+    "humanité": "humanity",
+    "humanités": "humanities",
+    "identité": "identity",
+    "identités": "identities",
+    "réalité": "reality",
+    "réalités": "realities",
+    "qualité": "quality",
+    "qualités": "qualities",
+    "liberté": "freedom",
+    "libertés": "freedoms",
+    "égalité": "equality",
+    "égalités": "equalities",
+    "fraternité": "fraternity",
+    "sécurité": "security",
+    "propriété": "property",
+    "propriétés": "properties",
+    "activité": "activity",
+    "activités": "activities",
+    "capacité": "capacity",
+    "capacités": "capacities",
+    "possibilité": "possibility",
+    "possibilités": "possibilities",
+    "université": "university",
+    "universités": "universities",
+    "faculté": "faculty",
+    "facultés": "faculties",
+    "spécialité": "specialty",
+    "spécialités": "specialties",
+    "généralité": "generality",
+    "généralités": "generalities",
+    "particularité": "particularity",
+    "particularités": "particularities"
+}
+
+# Case-insensitive lookup plus one alternation over every key, compiled once.
+# Longest keys come first so multi-word phrases win over the words inside them.
+# Terms spelled the same in both languages (art, design, information, ...) are
+# left out: they would only be replaced by themselves, and English keywords
+# and themes are full of them.
+_TRANSLATION_LOOKUP = {
+    french.casefold(): english for french, english in TRANSLATIONS.items()
+    if french.casefold() != english
+}
+_TRANSLATION_RE = re.compile(
+    r'\b(?:' + '|'.join(re.escape(k) for k in sorted(_TRANSLATION_LOOKUP, key=len, reverse=True)) + r')\b',
+    re.IGNORECASE
+)
+
+def _replace_translation(match) -> str:
+    """Return the English for a matched French term, following the match's case."""
+    matched_text = match.group(0)
+    english = _TRANSLATION_LOOKUP[matched_text.casefold()]
+    # Keys start with a letter and values are stored lower-case, so only a
+    # capitalised match needs more than one character test
+    if not matched_text[0].isupper():
+        return english
+    return english.upper() if matched_text.isupper() else english.capitalize()
+
+# Bibliography keywords and themes repeat heavily across rows, so results are
+# memoized (translate_keywords below is cached the same way)
+@lru_cache(maxsize=50000)
 def translate_text(text: str) -> str:
     """
     Translate French text to English using pattern matching and common translations.
@@ -119,302 +556,20 @@ def translate_text(text: str) -> str:
     if not text or pd.isna(text):
         return text
 
-    # Common French to English translations for academic/technical content
-    translations = {
-        # Academic terms
-        "résumé": "summary",
-        "mots-clés": "keywords",
-        "mots clés": "keywords",
-        "références bibliographiques": "bibliographic references",
-        "références": "references",
-        "auteur": "author",
-        "titre": "title",
-        "année": "year",
-        "éditeur": "publisher",
-        "chapitre": "chapter",
-        "ouvrage": "work",
-        "document": "document",
-        "étude": "study",
-        "recherche": "research",
-        "analyse": "analysis",
-        "thèse": "thesis",
-        "article": "article",
-        "livre": "book",
-        "revue": "journal",
-        "écritures": "writings",
-        "écriture": "writing",
-
-        # Technology terms
-        "intelligence artificielle": "artificial intelligence",
-        "réseaux sans fil": "wireless networks",
-        "technologie": "technology",
-        "informatique": "computer science",
-        "numérique": "digital",
-        "électronique": "electronic",
-        "logiciel": "software",
-        "matériel": "hardware",
-        "système": "system",
-        "algorithme": "algorithm",
-        "données": "data",
-        "base de données": "database",
-        "réseau": "network",
-        "internet": "internet",
-        "web": "web",
-        "site web": "website",
-        "application": "application",
-        "programme": "program",
-        "programmation": "programming",
-        "développement": "development",
-        "innovation": "innovation",
-        "évolution": "evolution",
-        "transformation": "transformation",
-        "automatisation": "automation",
-        "robotique": "robotics",
-        "cybernétique": "cybernetics",
-
-        # Science terms
-        "sciences": "sciences",
-        "physique": "physics",
-        "chimie": "chemistry",
-        "biologie": "biology",
-        "mathématiques": "mathematics",
-        "géologie": "geology",
-        "astronomie": "astronomy",
-        "médecine": "medicine",
-        "psychologie": "psychology",
-        "sociologie": "sociology",
-        "anthropologie": "anthropology",
-        "philosophie": "philosophy",
-        "histoire": "history",
-        "géographie": "geography",
-        "économie": "economics",
-        "politique": "politics",
-        "droit": "law",
-        "éducation": "education",
-        "enseignement": "teaching",
-        "apprentissage": "learning",
-        "formation": "training",
-        "université": "university",
-        "école": "school",
-        "institut": "institute",
-        "laboratoire": "laboratory",
-        "centre": "center",
-        "département": "department",
-        "faculté": "faculty",
-
-        # Art and culture terms
-        "art": "art",
-        "culture": "culture",
-        "littérature": "literature",
-        "musique": "music",
-        "peinture": "painting",
-        "sculpture": "sculpture",
-        "architecture": "architecture",
-        "théâtre": "theater",
-        "cinéma": "cinema",
-        "film": "film",
-        "photographie": "photography",
-        "design": "design",
-        "esthétique": "aesthetics",
-        "créativité": "creativity",
-        "artistique": "artistic",
-        "culturel": "cultural",
-        "patrimonial": "heritage",
-        "traditionnel": "traditional",
-        "moderne": "modern",
-        "contemporain": "contemporary",
-
-        # Media and communication
-        "médias": "media",
-        "communication": "communication",
-        "information": "information",
-        "journalisme": "journalism",
-        "presse": "press",
-        "radio": "radio",
-        "télévision": "television",
-        "diffusion": "broadcasting",
-        "publication": "publication",
-        "édition": "publishing",
-        "impression": "printing",
-
-        # Social and political terms
-        "société": "society",
-        "social": "social",
-        "public": "public",
-        "privé": "private",
-        "gouvernement": "government",
-        "administration": "administration",
-        "gestion": "management",
-        "organisation": "organization",
-        "institution": "institution",
-        "entreprise": "enterprise",
-        "industrie": "industry",
-        "commerce": "commerce",
-        "marché": "market",
-        "économique": "economic",
-        "financier": "financial",
-        "commercial": "commercial",
-        "industriel": "industrial",
-
-        # Time and space
-        "futur": "future",
-        "avenir": "future",
-        "présent": "present",
-        "passé": "past",
-        "historique": "historical",
-        "actuel": "current",
-        "nouveau": "new",
-        "ancien": "old",
-        "récent": "recent",
-        "moderne": "modern",
-        "traditionnel": "traditional",
-        "global": "global",
-        "international": "international",
-        "national": "national",
-        "régional": "regional",
-        "local": "local",
-
-        # Adjectives and descriptors
-        "important": "important",
-        "principal": "main",
-        "majeur": "major",
-        "mineur": "minor",
-        "central": "central",
-        "essentiel": "essential",
-        "nécessaire": "necessary",
-        "possible": "possible",
-        "difficile": "difficult",
-        "facile": "easy",
-        "complexe": "complex",
-        "simple": "simple",
-        "avancé": "advanced",
-        "basique": "basic",
-        "général": "general",
-        "spécifique": "specific",
-        "particulier": "particular",
-        "spécialisé": "specialized",
-
-        # Specific phrases found in the CSV
-        "enseignement supérieur artistique": "artistic higher education",
-        "révolution industrielle": "industrial revolution",
-        "changement climatique": "climate change",
-        "réalité virtuelle": "virtual reality",
-        "réalité augmentée": "augmented reality",
-        "apprentissage à distance": "distance learning",
-        "sciences cognitives": "cognitive sciences",
-        "nanotechnologies": "nanotechnologies",
-        "biotechnologies": "biotechnologies",
-        "interface cerveau-machine": "brain-machine interface",
-        "convergence technologique": "technological convergence",
-        "quatrième révolution industrielle": "fourth industrial revolution",
-
-        # Additional terms with accents and capitals
-        "créativité": "creativity",
-        "créative": "creative",
-        "créatif": "creative",
-        "créateurs": "creators",
-        "créateur": "creator",
-        "académique": "academic",
-        "académiques": "academic",
-        "économique": "economic",
-        "économiques": "economic",
-        "technologique": "technological",
-        "technologiques": "technological",
-        "industrielle": "industrial",
-        "industrielles": "industrial",
-        "culturelle": "cultural",
-        "culturelles": "cultural",
-        "scientifique": "scientific",
-        "scientifiques": "scientific",
-        "artistique": "artistic",
-        "artistiques": "artistic",
-        "éthique": "ethics",
-        "éthiques": "ethical",
-        "esthétique": "aesthetic",
-        "esthétiques": "aesthetic",
-        "théorie": "theory",
-        "théories": "theories",
-        "théorique": "theoretical",
-        "théoriques": "theoretical",
-        "pratique": "practice",
-        "pratiques": "practices",
-        "méthodologie": "methodology",
-        "méthodologies": "methodologies",
-        "pédagogie": "pedagogy",
-        "pédagogique": "pedagogical",
-        "pédagogiques": "pedagogical",
-        "didactique": "didactic",
-        "didactiques": "didactic",
-        "numérique": "digital",
-        "numériques": "digital",
-        "électronique": "electronic",
-        "électroniques": "electronic",
-        "mémoire": "memory",
-        "mémoires": "memories",
-        "société": "society",
-        "sociétés": "societies",
-        "sociétal": "societal",
-        "sociétaux": "societal",
-        "humanité": "humanity",
-        "humanités": "humanities",
-        "identité": "identity",
-        "identités": "identities",
-        "réalité": "reality",
-        "réalités": "realities",
-        "qualité": "quality",
-        "qualités": "qualities",
-        "liberté": "freedom",
-        "libertés": "freedoms",
-        "égalité": "equality",
-        "égalités": "equalities",
-        "fraternité": "fraternity",
-        "sécurité": "security",
-        "propriété": "property",
-        "propriétés": "properties",
-        "activité": "activity",
-        "activités": "activities",
-        "capacité": "capacity",
-        "capacités": "capacities",
-        "possibilité": "possibility",
-        "possibilités": "possibilities",
-        "université": "university",
-        "universités": "universities",
-        "faculté": "faculty",
-        "facultés": "faculties",
-        "spécialité": "specialty",
-        "spécialités": "specialties",
-        "généralité": "generality",
-        "généralités": "generalities",
-        "particularité": "particularity",
-        "particularités": "particularities"
-    }
+    # Replace whole words only, case insensitive, in a single pass
+    return _TRANSLATION_RE.sub(_replace_translation, text)
 
-    # Apply translations (case insensitive with proper case handling)
-    result = text
-    for french, english in translations.items():
-        # Create a more comprehensive pattern that handles case variations
-        def replace_match(match):
-            matched_text = match.group(0)
-            if matched_text.isupper():
-                return english.upper()
-            elif matched_text.istitle() or matched_text[0].isupper():
-                return english.capitalize()
-            else:
-                return english.lower()
-
-        # Replace whole words only, case insensitive
-        pattern = r'\b' + re.escape(french) + r'\b'
-        result = re.sub(pattern, replace_match, result, flags=re.IGNORECASE)
-
-    return result
+# Separators between keywords: commas/semicolons or numbered list items
+_KW_SPLIT = re.compile(r'[,;]\s*|\n\d+\.\s*')
 
+@lru_cache(maxsize=50000)
 def translate_keywords(keywords: str) -> str:
     """Translate keywords specifically, handling numbered lists and separators."""
     if not keywords or pd.isna(keywords):
         return keywords
 
     # Split on common separators and translate each part
-    parts = re.split(r'[,;]\s*|\n\d+\.\s*', keywords)
+    parts = _KW_SPLIT.split(keywords)
     translated_parts = []
 
     for part in parts:
@@ -431,6 +586,16 @@ def translate_theme(theme: str) -> str:
 
     return translate_text(theme)
 
+def french_mask(values: pd.Series) -> pd.Series:
+    """Boolean mask of the non-empty cells in a column that look French."""
+    # Keywords and themes repeat a lot, so run the detector once per distinct value
+    present = values.dropna()
+    looks_french = {
+        value: bool(str(value).strip()) and not is_mostly_english(str(value))
+        for value in present.unique()
+    }
+    return present.map(looks_french).reindex(values.index, fill_value=False).astype(bool)
+
 def process_csv_translation():
     """Process the CSV file and translate French fields to English."""
 
@@ -442,32 +607,22 @@ def process_csv_translation():
     print("ANALYZING CSV FOR FRENCH CONTENT...")
     print("="*80)
 
-    df_full = pd.read_csv(csv_path)
+    # Every column is text here, so skip dtype inference; numeric-looking columns
+    # such as year are also written back exactly as read instead of as floats
+    df_full = pd.read_csv(csv_path, dtype=str)
     total_rows = len(df_full)
 
-    french_summaries = 0
-    french_keywords = 0
-    french_themes = 0
-
     print(f"\nTotal rows in CSV: {total_rows}")
 
-    # Count French summaries
-    if 'summary' in df_full.columns:
-        for idx, summary in df_full['summary'].items():
-            if pd.notna(summary) and str(summary).strip() and not is_mostly_english(str(summary)):
-                french_summaries += 1
-
-    # Count French keywords
-    if 'keywords' in df_full.columns:
-        for idx, keywords in df_full['keywords'].items():
-            if pd.notna(keywords) and str(keywords).strip() and not is_mostly_english(str(keywords)):
-                french_keywords += 1
-
-    # Count French themes
-    if 'theme' in df_full.columns:
-        for idx, theme in df_full['theme'].items():
-            if pd.notna(theme) and str(theme).strip() and not is_mostly_english(str(theme)):
-                french_themes += 1
+    # Detect French content once per column; the summary mask is reused below
+    # to pick the rows that need the neural model
+    french_masks = {
+        column: french_mask(df_full[column])
+        for column in ('summary', 'keywords', 'theme') if column in df_full.columns
+    }
+    french_summaries = int(french_masks['summary'].sum()) if 'summary' in french_masks else 0
+    french_keywords = int(french_masks['keywords'].sum()) if 'keywords' in french_masks else 0
+    french_themes = int(french_masks['theme'].sum()) if 'theme' in french_masks else 0
 
     print(f"\n📊 FRENCH CONTENT DETECTED:")
     print(f"  • Summaries in French: {french_summaries:,} / {total_rows:,} ({french_summaries*100/total_rows:.1f}%)")
@@ -476,63 +631,72 @@ def process_csv_translation():
 
     estimated_translations = french_summaries + french_keywords + french_themes
     print(f"\n⏱️  Estimated translations needed: ~{estimated_translations:,}")
-    print(f"   (Summaries will use neural translation, keywords/themes use pattern matching)")
+    print(f"   (Neural model: {french_summaries:,} summaries; keywords/themes use pattern matching only)")
 
     print("\n" + "="*80)
     print("STARTING TRANSLATION PROCESS...")
     print("="*80)
 
-    # Initialize translation model
-    init_translation_model()
-
-    # Read CSV in chunks to handle large file
+    # Only summaries go through the neural model; don't load it if none need it.
+    # Each distinct French summary is translated once, in a single batched pass,
+    # and the slices below just look the results up
+    summary_translations = {}
+    if french_summaries:
+        init_translation_model()
+        unique_summaries = df_full.loc[french_masks['summary'], 'summary'].drop_duplicates().tolist()
+        print(f"\nTranslating {len(unique_summaries):,} distinct French summaries...")
+        summary_translations = dict(zip(unique_summaries, translate_batch(unique_summaries)))
+
+    # Work through the already-loaded rows in slices instead of re-reading the file,
+    # writing each translated slice out as soon as it is done
     chunk_size = 100  # Smaller chunks for neural translation
-    chunks = []
-    rows_processed = 0
-
-    for chunk in pd.read_csv(csv_path, chunksize=chunk_size):
-        rows_processed += len(chunk)
-        print(f"\n--- Processing chunk: rows {rows_processed - len(chunk) + 1} to {rows_processed} of {total_rows} ---")
-
-        # Translate summary field using neural model
-        if 'summary' in chunk.columns:
-            print("Checking summaries for French content...")
-            chunk['summary'] = chunk['summary'].apply(lambda x: translate_with_model(x) if pd.notna(x) and str(x).strip() else x)
-
-        # Translate keywords field using pattern matching
-        if 'keywords' in chunk.columns:
-            print("Translating keywords (pattern matching)...")
-            translated_keywords = chunk['keywords'].apply(translate_keywords)
-            chunk['keywords'] = translated_keywords
-            if 'keywords_en' in chunk.columns:
-                chunk['keywords_en'] = translated_keywords
-
-        # Translate theme field using pattern matching
-        if 'theme' in chunk.columns:
-            print("Translating themes (pattern matching)...")
-            translated_theme = chunk['theme'].apply(translate_theme)
-            chunk['theme'] = translated_theme
-            if 'theme_en' in chunk.columns:
-                chunk['theme_en'] = translated_theme
-
-        chunks.append(chunk)
-
-    # Combine all chunks
-    print("Combining chunks...")
-    df = pd.concat(chunks, ignore_index=True)
-
-    # Save the translated CSV
     output_path = "/Users/murexpecten/Code/the-library/data/biblio/bibliographie_finale_these_FINAL_translated.csv"
-    print(f"Saving translated CSV to {output_path}...")
-    df.to_csv(output_path, index=False)
-
-    print(f"Translation complete! Processed {len(df)} rows.")
+    print(f"Writing translated CSV to {output_path}...")
+    sample = df_full.head(0)
+
+    with open(output_path, 'w', newline='', encoding='utf-8') as output_file:
+        for start in range(0, total_rows, chunk_size):
+            chunk = df_full.iloc[start:start + chunk_size].copy()
+            print(f"\n--- Processing chunk: rows {start + 1} to {start + len(chunk)} of {total_rows} ---")
+
+            # Translate summary field using neural model
+            if 'summary' in chunk.columns:
+                print("Applying summary translations...")
+                french_rows = chunk.index[french_masks['summary'].loc[chunk.index]]
+                if len(french_rows):
+                    chunk.loc[french_rows, 'summary'] = chunk.loc[french_rows, 'summary'].map(summary_translations)
+
+            # Translate keywords field using pattern matching
+            if 'keywords' in chunk.columns:
+                print("Translating keywords (pattern matching)...")
+                translated_keywords = pd.Series(
+                    [translate_keywords(keywords) for keywords in chunk['keywords'].tolist()], index=chunk.index
+                )
+                chunk['keywords'] = translated_keywords
+                if 'keywords_en' in chunk.columns:
+                    chunk['keywords_en'] = translated_keywords
+
+            # Translate theme field using pattern matching
+            if 'theme' in chunk.columns:
+                print("Translating themes (pattern matching)...")
+                translated_theme = pd.Series(
+                    [translate_theme(theme) for theme in chunk['theme'].tolist()], index=chunk.index
+                )
+                chunk['theme'] = translated_theme
+                if 'theme_en' in chunk.columns:
+                    chunk['theme_en'] = translated_theme
+
+            chunk.to_csv(output_file, header=start == 0, index=False)
+            if start == 0:
+                sample = chunk.head(3)
+
+    print(f"Translation complete! Processed {total_rows} rows.")
     print(f"Original file: {csv_path}")
     print(f"Translated file: {output_path}")
 
     # Show sample of translated content
     print("\nSample of translated content:")
-    for i, row in df.head(3).iterrows():
+    for i, row in sample.iterrows():
         print(f"\nRow {i+1}:")
         print(f"Title: {row['title']}")
         if 'summary' in row and pd.notna(row['summary']):
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Test backup file integrity and contents."""
 
+import hashlib
+import os
+import tempfile
 import zipfile
 import sqlite3
 import sys
@@ -28,9 +31,23 @@ def test_backup(backup_file):
             print('Test 2: Checking for required files...')
             files = zf.namelist()
 
-            has_db = any('library.db' in f for f in files)
-            has_csv = any('.csv' in f for f in files)
-            has_json = any('.json' in f for f in files)
+            # One pass over the archive: presence flags, file lists and sizes
+            has_db = has_csv = has_json = False
+            csv_files = []
+            json_files = []
+            total_size = 0
+            compressed_size = 0
+            for info in zf.infolist():
+                name = info.filename
+                has_db = has_db or 'library.db' in name
+                has_csv = has_csv or '.csv' in name
+                has_json = has_json or '.json' in name
+                if name.endswith('.csv'):
+                    csv_files.append(info)
+                elif name.endswith('.json'):
+                    json_files.append(info)
+                total_size += info.file_size
+                compressed_size += info.compress_size
 
             db_status = '[OK] Found' if has_db else '[FAIL] Missing'
             csv_status = '[OK] Found' if has_csv else '[FAIL] Missing'
@@ -49,73 +66,95 @@ def test_backup(backup_file):
             print()
             print('Test 3: Extracting and testing database...')
 
-            # Extract to temp directory
-            test_dir = Path('backups/test_restore')
-            if test_dir.exists():
-                shutil.rmtree(test_dir)
-            test_dir.mkdir(parents=True)
-
-            zf.extractall(test_dir)
-            print('  [OK] Files extracted successfully')
-
-            # Test database integrity
-            db_path = test_dir / 'index' / 'library.db'
-            if not db_path.exists():
-                print('  [FAIL] Database file not found after extraction')
+            db_member = 'index/library.db'
+            if db_member not in files:
+                print('  [FAIL] Database file not found in backup')
                 return False
 
-            conn = sqlite3.connect(db_path)
-            cursor = conn.cursor()
-
-            # Test basic queries
-            cursor.execute('SELECT COUNT(*) FROM books')
-            book_count = cursor.fetchone()[0]
-            print(f'  [OK] Database readable: {book_count} books')
-
-            cursor.execute('SELECT COUNT(*) FROM quotes')
-            quote_count = cursor.fetchone()[0]
-            print(f'  [OK] Database readable: {quote_count} quotes')
-
-            # Test a sample query
-            cursor.execute('SELECT title FROM books LIMIT 1')
-            sample = cursor.fetchone()
-            if sample:
-                title_preview = sample[0][:50]
-                print(f'  [OK] Sample book title: "{title_preview}..."')
-
-            # Check table structure
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-            tables = [row[0] for row in cursor.fetchall()]
-            print(f'  [OK] Found {len(tables)} tables: {", ".join(tables)}')
-
-            conn.close()
+            # CRC-check every other member without writing it out; the database
+            # is checked in the single extraction pass below
+            for info in zf.infolist():
+                if info.filename == db_member:
+                    continue
+                try:
+                    with zf.open(info) as f:
+                        while f.read(1 << 20):
+                            pass
+                except zipfile.BadZipFile:
+                    print(f'  [FAIL] Corrupt file in backup: {info.filename}')
+                    return False
+            print('  [OK] All file checksums valid')
+
+            # Copy the (stored, uncompressed) database out while hashing it,
+            # into a temp directory (RAM-backed when available)
+            test_dir = Path(tempfile.mkdtemp(dir='/dev/shm' if os.path.isdir('/dev/shm') else None))
+            try:
+                db_path = test_dir / 'library.db'
+                sha = hashlib.sha256()
+                with zf.open(db_member) as src, open(db_path, 'wb') as dst:
+                    while chunk := src.read(1 << 20):
+                        sha.update(chunk)
+                        dst.write(chunk)
+                print('  [OK] Database extracted successfully')
+
+                sidecar = db_member + '.sha256'
+                if sidecar in files:
+                    expected = zf.read(sidecar).decode().split()[0]
+                    if sha.hexdigest() != expected:
+                        print('  [FAIL] Database SHA-256 does not match library.db.sha256')
+                        return False
+                    print('  [OK] Database SHA-256 matches sidecar')
+                else:
+                    print('  [WARN] No library.db.sha256 in backup, skipped SHA-256 check')
+
+                # Read-only and immutable: no locking, no WAL recovery, file untouched
+                conn = sqlite3.connect(f'{db_path.resolve().as_uri()}?mode=ro&immutable=1', uri=True)
+                cursor = conn.cursor()
+
+                # Test basic queries
+                cursor.execute('SELECT COUNT(*) FROM books')
+                book_count = cursor.fetchone()[0]
+                print(f'  [OK] Database readable: {book_count} books')
+
+                cursor.execute('SELECT COUNT(*) FROM quotes')
+                quote_count = cursor.fetchone()[0]
+                print(f'  [OK] Database readable: {quote_count} quotes')
+
+                # Test a sample query
+                cursor.execute('SELECT title FROM books LIMIT 1')
+                sample = cursor.fetchone()
+                if sample:
+                    title_preview = sample[0][:50]
+                    print(f'  [OK] Sample book title: "{title_preview}..."')
+
+                # Check table structure
+                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+                tables = [row[0] for row in cursor.fetchall()]
+                print(f'  [OK] Found {len(tables)} tables: {", ".join(tables)}')
+
+                conn.close()
+            finally:
+                shutil.rmtree(test_dir, ignore_errors=True)
 
             # Test 4: Verify file counts and sizes
             print()
             print('Test 4: File statistics...')
-            csv_files = [f for f in files if f.endswith('.csv')]
-            json_files = [f for f in files if f.endswith('.json')]
-
             print(f'  CSV files in backup: {len(csv_files)}')
-            for csv_file in csv_files:
-                info = zf.getinfo(csv_file)
+            for info in csv_files:
                 size_kb = info.file_size / 1024
-                print(f'    - {csv_file} ({size_kb:.1f} KB)')
+                print(f'    - {info.filename} ({size_kb:.1f} KB)')
 
             print(f'  JSON files in backup: {len(json_files)}')
             print(f'  Total files in backup: {len(files)}')
 
-            # Calculate total backup size
-            total_size = sum(zf.getinfo(f).file_size for f in files)
-            compressed_size = sum(zf.getinfo(f).compress_size for f in files)
+            # Total backup size was tallied in the same pass
             compression_ratio = (1 - compressed_size / total_size) * 100
 
             print(f'  Uncompressed size: {total_size / 1024 / 1024:.2f} MB')
             print(f'  Compressed size: {compressed_size / 1024 / 1024:.2f} MB')
             print(f'  Compression ratio: {compression_ratio:.1f}%')
 
-            # Cleanup
-            shutil.rmtree(test_dir)
+            # Cleanup: the extracted database was removed when the check finished
             print()
             print('  [OK] Cleanup completed')
 